@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import argparse
-import json
+import os
 import sys
 import threading
 import time
@@ -11,12 +11,13 @@ from datetime import datetime, timezone
 from functools import partial
 from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+from simulation._json import dumps, loads
 from simulation.cli import build_lineup
 from simulation.fixtures import SAMPLE_DEFENSE, SAMPLE_PITCHER, SAMPLE_STADIUM
 from simulation.state import GameState, HalfInningState
@@ -78,16 +79,50 @@ def generate_payload(args: argparse.Namespace) -> dict:
 def _load_artifact(path: Path) -> Optional[dict]:
     if not path.exists():
         return None
-    return json.loads(path.read_text(encoding="utf-8"))
+    return loads(path.read_bytes())
 
 
-def write_feed(payload: dict, path: Path) -> None:
+def write_feed(payload: dict, path: Path, *, pretty: bool = False) -> None:
+    """Replace the feed atomically so the viewer never fetches a half-written file."""
+
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    staging = path.with_suffix(path.suffix + ".tmp")
+    with open(staging, "wb") as handle:
+        handle.write(dumps(payload, indent=pretty))
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(staging, path)
+
+
+class SendfileRequestHandler(SimpleHTTPRequestHandler):
+    """Static file handler that lets the kernel copy file bodies to the socket."""
+
+    def copyfile(self, source: BinaryIO, outputfile: BinaryIO) -> None:
+        try:
+            in_fd = source.fileno()
+            out_fd = outputfile.fileno()
+            offset = source.tell()
+            remaining = os.fstat(in_fd).st_size - offset
+        except (AttributeError, OSError, ValueError):
+            super().copyfile(source, outputfile)
+            return
+
+        outputfile.flush()
+        try:
+            sent = os.sendfile(out_fd, in_fd, offset, remaining)
+        except (AttributeError, OSError):
+            # sendfile is missing on this platform or unsupported for these fds.
+            super().copyfile(source, outputfile)
+            return
+
+        while 0 < sent < remaining:
+            offset += sent
+            remaining -= sent
+            sent = os.sendfile(out_fd, in_fd, offset, remaining)
 
 
 def start_server(directory: Path, port: int) -> ThreadingHTTPServer:
-    handler = partial(SimpleHTTPRequestHandler, directory=str(directory))
+    handler = partial(SendfileRequestHandler, directory=str(directory))
     httpd = ThreadingHTTPServer(("0.0.0.0", port), handler)
     thread = threading.Thread(target=httpd.serve_forever, daemon=True)
     thread.start()
@@ -107,11 +142,11 @@ def run_once(args: argparse.Namespace) -> None:
     else:
         payload.setdefault("updated_at", _timestamp())
 
-    write_feed(payload, output_path)
+    write_feed(payload, output_path, pretty=args.pretty)
     print(f"Wrote replay feed with {len(payload.get('events', []))} events to {output_path}")
 
 
-def parse_args() -> argparse.Namespace:
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Generate a replay feed and serve the viewer")
     parser.add_argument("--full-game", action="store_true", help="Play a full game instead of a single half-inning")
     parser.add_argument("--lineup-size", type=int, default=3, help="Number of batters in each lineup")
@@ -126,6 +161,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--disable-crowd-effects", action="store_true", help="Ignore crowd modifiers during simulation")
     parser.add_argument("--disable-stadium-effects", action="store_true", help="Ignore stadium modifiers during simulation")
     parser.add_argument("--enable-organ-flair", action="store_true", help="Allow the optional organ agent to add small boosts")
+    parser.add_argument("--pretty", action="store_true", help="Indent the replay feed for human reading")
     parser.add_argument("--output", type=Path, default=Path("web/replay.json"), help="Where to write the replay feed")
     parser.add_argument(
         "--artifact-path",
@@ -142,7 +178,14 @@ def parse_args() -> argparse.Namespace:
         default=PROJECT_ROOT / "web",
         help="Directory to serve when running the dev HTTP server",
     )
-    return parser.parse_args()
+    return parser
+
+
+_PARSER = _build_parser()
+
+
+def parse_args() -> argparse.Namespace:
+    return _PARSER.parse_args()
 
 
 def main() -> int:
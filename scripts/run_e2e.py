@@ -2,48 +2,91 @@
 from __future__ import annotations
 
 import argparse
-import json
-import subprocess
+import hashlib
+import shutil
 import sys
 from pathlib import Path
 from typing import Dict
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from simulation._json import dumps
+from simulation.cli import _PARSER as _CLI_PARSER, run_full_game
+
 DEFAULT_SEED = 42
 DEFAULT_ARTIFACT_DIR = Path("tmp/e2e")
+GAME_ID = "e2e-sample"
+
+
+def _cache_key(seed: int, game_id: str) -> str:
+    """Hash the run inputs together with every source file that shapes the output."""
+
+    digest = hashlib.blake2b(f"{seed}|{game_id}".encode("utf-8"), digest_size=16)
+    sources = sorted((PROJECT_ROOT / "simulation").glob("*.py")) + [Path(__file__).resolve()]
+    for source in sources:
+        digest.update(source.name.encode("utf-8"))
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
 
+def run_cli(seed: int, artifact_dir: Path, *, use_cache: bool = True) -> Dict[str, Path]:
+    """Play the seeded e2e game, reusing cached artifacts when the inputs are unchanged.
+
+    The simulation is deterministic for a given seed, so outputs are stored under
+    ``artifact_dir/cache/<key>`` and copied back out on later runs instead of
+    replaying the game.
+    """
 
-def run_cli(seed: int, artifact_dir: Path) -> Dict[str, Path]:
     artifact_dir.mkdir(parents=True, exist_ok=True)
 
     replay_path = artifact_dir / "replay_log.json"
     season_state_path = artifact_dir / "season_state.json"
     box_score_path = artifact_dir / "box_score_summary.json"
-
-    cmd = [
-        sys.executable,
-        "-m",
-        "simulation.cli",
-        "--full-game",
-        "--json",
-        f"--seed={seed}",
-        f"--replay-log={replay_path}",
-        f"--season-state-path={season_state_path}",
-        "--game-id",
-        "e2e-sample",
-    ]
-
-    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-    summary = json.loads(result.stdout)
-    box_score_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
-
-    return {
+    artifacts = {
         "replay": replay_path,
         "season_state": season_state_path,
         "box_score": box_score_path,
     }
 
+    cache_dir = artifact_dir / "cache" / _cache_key(seed, GAME_ID)
+    if use_cache and all((cache_dir / path.name).exists() for path in artifacts.values()):
+        for path in artifacts.values():
+            shutil.copyfile(cache_dir / path.name, path)
+        return artifacts
 
-def parse_args() -> argparse.Namespace:
+    cli_args = _CLI_PARSER.parse_args(
+        [
+            "--full-game",
+            f"--seed={seed}",
+            f"--replay-log={replay_path}",
+            f"--season-state-path={season_state_path}",
+            "--game-id",
+            GAME_ID,
+        ]
+    )
+
+    summary = run_full_game(cli_args)
+    box_score_path.write_bytes(dumps(summary.to_dict()))
+
+    if use_cache:
+        # Only the current key can ever hit again; any sibling was written for
+        # sources that have since changed, so drop it rather than let the
+        # cache grow with every edit.
+        if cache_dir.parent.is_dir():
+            for stale in cache_dir.parent.iterdir():
+                if stale != cache_dir and stale.is_dir():
+                    shutil.rmtree(stale)
+        # Copy rather than hard-link: later runs rewrite the outputs in place.
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for path in artifacts.values():
+            shutil.copyfile(path, cache_dir / path.name)
+
+    return artifacts
+
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Run a seeded full game and capture artifacts.")
     parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Seed for deterministic simulation output")
     parser.add_argument(
@@ -52,12 +95,24 @@ def parse_args() -> argparse.Namespace:
         default=DEFAULT_ARTIFACT_DIR,
         help="Directory to store generated artifacts",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always replay the game instead of reusing cached artifacts",
+    )
+    return parser
+
+
+_PARSER = _build_parser()
+
+
+def parse_args() -> argparse.Namespace:
+    return _PARSER.parse_args()
 
 
 def main() -> int:
     args = parse_args()
-    artifacts = run_cli(seed=args.seed, artifact_dir=args.artifact_dir)
+    artifacts = run_cli(seed=args.seed, artifact_dir=args.artifact_dir, use_cache=not args.no_cache)
     print("Generated artifacts:")
     for name, path in artifacts.items():
         print(f"- {name}: {path}")
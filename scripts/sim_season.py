@@ -2,12 +2,12 @@
 from __future__ import annotations
 
 import argparse
-import json
 import random
-from collections import deque
-from dataclasses import asdict, replace
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import replace
 from pathlib import Path
-from typing import Deque, Dict, Iterable, List, MutableMapping, Sequence
+from typing import Dict, Iterable, Iterator, List, Mapping, MutableMapping, Sequence, Tuple
 
 import sys
 
@@ -15,9 +15,10 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+from simulation._json import dumps
 from simulation.fixtures import SAMPLE_BATTER, SAMPLE_DEFENSE, SAMPLE_PITCHER, SAMPLE_STADIUM
 from simulation.management_bridge import load_management_state
-from simulation.persistence import FinanceLedger, SeasonState, TeamStanding, save_season_state
+from simulation.persistence import BoxScoreLog, BoxScoreSummary, FinanceLedger, SeasonState, TeamStanding, save_season_state
 from simulation.state import GameState
 
 DEFAULT_GAMES = 50
@@ -27,11 +28,15 @@ CROWD_MAX = 100.0
 RECOVERY_PER_GAME = 50
 
 
-def _rated_lineup(entries: Sequence[MutableMapping[str, object]]) -> List[Dict[str, object]]:
-    """Apply the sample batter ratings to every lineup slot while preserving names."""
+def _rated_lineup(entries: Sequence[MutableMapping[str, object]]) -> Tuple[Dict[str, object], ...]:
+    """Apply the sample batter ratings to every lineup slot while preserving names.
+
+    Every slot shares the one frozen ``BatterRatings`` instance; the slots are
+    built once per season and only ever indexed afterwards.
+    """
 
     template = SAMPLE_BATTER["ratings"]
-    return [{"name": entry.get("name", "Unknown"), "ratings": template} for entry in entries]
+    return tuple({"name": entry.get("name", "Unknown"), "ratings": template} for entry in entries)
 
 
 def _rotation_names(entries: Sequence[MutableMapping[str, object]], fallback: str) -> List[str]:
@@ -39,42 +44,48 @@ def _rotation_names(entries: Sequence[MutableMapping[str, object]], fallback: st
     return names or [fallback]
 
 
-def _rotate_lineup(lineup: Sequence[Dict[str, object]], offset: int) -> List[Dict[str, object]]:
-    rotated: Deque[Dict[str, object]] = deque(lineup)
-    rotated.rotate(-offset)
-    return list(rotated)
-
+def _lineup_rotations(
+    lineup: Sequence[Dict[str, object]], count: int, *, start: int = 0, reverse: bool = False
+) -> List[Tuple[Dict[str, object], ...]]:
+    """Precompute ``count`` batting orders, each shifted one slot further than the last.
 
-def _count_team_pitches(replay_log: Iterable[MutableMapping[str, object]], batting_team: str) -> int:
-    count = 0
-    for payload in replay_log:
-        half = payload.get("half_inning", {}) or {}
-        if half.get("batting_team") == batting_team:
-            count += 1
-    return count
+    With ``reverse`` the orders are read back-to-front from ``lineup`` by index,
+    so no reversed copy of the template is needed.
+    """
 
+    size = len(lineup)
+    rotations: List[Tuple[Dict[str, object], ...]] = []
+    for offset in range(start, start + count):
+        if reverse:
+            rotations.append(tuple(lineup[size - 1 - (offset + slot) % size] for slot in range(size)))
+        else:
+            shift = offset % size if size else 0
+            rotations.append(tuple(lineup[shift:]) + tuple(lineup[:shift]))
+    return rotations
 
-def _validate_crowd_modifiers(replay_log: Iterable[MutableMapping[str, object]]) -> None:
-    for payload in replay_log:
-        modifiers = (payload.get("modifiers") or {}).get("crowd", {})
-        context_crowd = (payload.get("context") or {}).get("crowd", {})
-        before = float(context_crowd.get("energy_before", 0.0))
-        after = float(context_crowd.get("energy_after", 0.0))
-
-        if before < 0 or after < 0 or before > CROWD_MAX or after > CROWD_MAX:
-            raise AssertionError(f"Crowd energy exceeded bounds: before={before}, after={after}")
 
+def _validate_crowd_modifiers(crowd_modifiers: Iterable[Mapping[str, float]]) -> None:
+    for modifiers in crowd_modifiers:
         for key, value in modifiers.items():
             if value < -CROWD_CAP or value > CROWD_CAP:
                 raise AssertionError(f"Crowd modifier {key} out of bounds: {value}")
 
 
+def _validate_crowd_energy(game: GameState) -> None:
+    for label, column in (("before", game.crowd_energy_before), ("after", game.crowd_energy_after)):
+        if not column:
+            continue
+        low, high = min(column), max(column)
+        if low < 0 or high > CROWD_MAX:
+            raise AssertionError(f"Crowd energy exceeded bounds: {label} ranged {low}..{high}")
+
+
 def _apply_series_economics(ledger: FinanceLedger, series_length: int) -> Dict[str, float]:
     promo_multiplier = 1 + 0.05 * len(ledger.promotions)
     gate_revenue = ledger.ticket_price * 1000 * series_length * promo_multiplier
-    concessions_revenue = sum(ledger.concessions_pricing.values()) * 75 * series_length
-    recurring_revenue = sum(ledger.revenue.values())
-    recurring_expenses = sum(ledger.expenses.values())
+    concessions_revenue = ledger.concessions_total * 75 * series_length
+    recurring_revenue = ledger.recurring_revenue
+    recurring_expenses = ledger.recurring_expenses
     upkeep = 5000 * series_length
 
     revenue = gate_revenue + concessions_revenue + recurring_revenue
@@ -96,34 +107,89 @@ def _apply_series_economics(ledger: FinanceLedger, series_length: int) -> Dict[s
 
 
 def _rest_rotation(fatigue: Dict[str, float], *, reset: bool = False) -> None:
-    for name, current in list(fatigue.items()):
+    # Only existing keys are reassigned, so iterating the live view is safe.
+    for name, current in fatigue.items():
         fatigue[name] = 0.0 if reset else max(0.0, current - RECOVERY_PER_GAME)
 
 
-def _record_standings(standings: Dict[str, TeamStanding], summary, home_team: str, away_team: str) -> None:
-    home = standings.setdefault(home_team, TeamStanding(team_id=home_team, wins=0, losses=0))
-    away = standings.setdefault(away_team, TeamStanding(team_id=away_team, wins=0, losses=0))
+class _StandingsTable:
+    """Season tallies kept in parallel lists indexed by a fixed team slot.
+
+    Slots are positions in ``team_ids`` rather than names, so two clubs that
+    share a display name still keep separate records.
+    """
+
+    def __init__(self, team_ids: Sequence[str]) -> None:
+        self.team_ids = list(team_ids)
+        self.wins = [0] * len(self.team_ids)
+        self.losses = [0] * len(self.team_ids)
+        self.runs_for = [0] * len(self.team_ids)
+        self.runs_against = [0] * len(self.team_ids)
+        self.games_recorded = 0
+
+    def record(self, summary: BoxScoreSummary, home: int, away: int) -> None:
+        self.runs_for[home] += summary.home_score
+        self.runs_against[home] += summary.away_score
+        self.runs_for[away] += summary.away_score
+        self.runs_against[away] += summary.home_score
+
+        if summary.home_score > summary.away_score:
+            self.wins[home] += 1
+            self.losses[away] += 1
+        elif summary.home_score < summary.away_score:
+            self.wins[away] += 1
+            self.losses[home] += 1
+
+        self.games_recorded += 1
+
+    def to_standings(self) -> List[TeamStanding]:
+        if not self.games_recorded:
+            return []
+        return [
+            TeamStanding(
+                team_id=team_id,
+                wins=self.wins[slot],
+                losses=self.losses[slot],
+                runs_for=self.runs_for[slot],
+                runs_against=self.runs_against[slot],
+            )
+            for slot, team_id in enumerate(self.team_ids)
+        ]
+
+
+def _play_season_game(spec: Dict[str, object]) -> Tuple[BoxScoreSummary, int, int]:
+    """Play and validate one game, returning its summary and each staff's pitch count.
+
+    Kept at module scope so worker processes can unpickle it.
+    """
+
+    game = GameState(
+        **spec,
+        home_pitcher=SAMPLE_PITCHER["ratings"],
+        away_pitcher=SAMPLE_PITCHER["ratings"],
+        home_defense=SAMPLE_DEFENSE,
+        away_defense=SAMPLE_DEFENSE,
+        stadium_modifiers=SAMPLE_STADIUM["modifiers"],
+        enable_organ_flair=True,
+    )
+    summary = game.play_game()
+
+    _validate_crowd_energy(game)
+    _validate_crowd_modifiers(game.replay_log.crowd_modifiers)
 
-    home.runs_for += summary.home_score
-    home.runs_against += summary.away_score
-    away.runs_for += summary.away_score
-    away.runs_against += summary.home_score
+    home_pitches, away_pitches = game.pitches_thrown()
+    return summary, home_pitches, away_pitches
 
-    if summary.home_score > summary.away_score:
-        home.wins += 1
-        away.losses += 1
-    elif summary.home_score < summary.away_score:
-        away.wins += 1
-        home.losses += 1
 
+def _play_season_games(
+    game_specs: Sequence[Dict[str, object]], workers: int
+) -> Iterator[Tuple[BoxScoreSummary, int, int]]:
+    if workers <= 1:
+        yield from map(_play_season_game, game_specs)
+        return
 
-def _serialize_finances(ledger: FinanceLedger) -> Dict[str, object]:
-    payload = asdict(ledger)
-    payload["revenue"] = dict(payload.get("revenue", {}))
-    payload["expenses"] = dict(payload.get("expenses", {}))
-    payload["promotions"] = list(payload.get("promotions", []))
-    payload["concessions_pricing"] = dict(payload.get("concessions_pricing", {}))
-    return payload
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_play_season_game, game_specs)
 
 
 def run_simulated_season(
@@ -133,12 +199,25 @@ def run_simulated_season(
     season_year: int,
     seed: int | None = None,
     season_state_path: Path | None = None,
+    workers: int = 1,
+    stream_box_scores: bool = False,
 ) -> Dict[str, object]:
+    """Play ``games`` games and fold their results into a persisted season.
+
+    Games only depend on their own seed and lineups, so with ``workers > 1``
+    they are played in a process pool. Results are still folded in schedule
+    order, keeping standings, fatigue, and economics identical to a serial run.
+
+    With ``stream_box_scores`` the box scores go to a JSONL sidecar beside
+    ``season_state_path`` as games finish instead of being embedded in it.
+    """
+
     rng = random.Random(seed)
     manager_state = load_management_state()
 
-    home_lineup_template = _rated_lineup(manager_state.lineup)
-    away_lineup_template = list(reversed(home_lineup_template))
+    lineup_template = _rated_lineup(manager_state.lineup)
+    home_rotations = _lineup_rotations(lineup_template, series_length)
+    away_rotations = _lineup_rotations(lineup_template, series_length, start=1, reverse=True)
 
     rotation = _rotation_names(manager_state.rotation, SAMPLE_PITCHER["name"])
     away_rotation = list(reversed(rotation)) or rotation
@@ -154,66 +233,68 @@ def run_simulated_season(
     )
 
     season_state = SeasonState.empty(season_year)
-    standings: Dict[str, TeamStanding] = {}
+    # The managed club is always home and the rival away, so slot by role.
+    home_slot, away_slot = 0, 1
+    standings = _StandingsTable([manager_state.team_name, "Rival Club"])
     fatigue_tracker: Dict[str, float] = {name: 0.0 for name in rotation + away_rotation}
 
     economics_log: List[Dict[str, float]] = []
 
-    for game_index in range(games):
-        series_index = game_index // series_length
-        series_game = game_index % series_length
-
-        home_lineup = _rotate_lineup(home_lineup_template, series_game)
-        away_lineup = _rotate_lineup(away_lineup_template, (series_game + 1) % len(away_lineup_template))
-
-        home_pitcher_name = rotation[game_index % len(rotation)]
-        away_pitcher_name = away_rotation[game_index % len(away_rotation)]
-
-        game = GameState(
-            game_id=f"season-game-{game_index+1:03d}",
-            home_team=manager_state.team_name,
-            away_team="Rival Club",
-            home_lineup=home_lineup,
-            away_lineup=away_lineup,
-            home_pitcher=SAMPLE_PITCHER["ratings"],
-            away_pitcher=SAMPLE_PITCHER["ratings"],
-            home_defense=SAMPLE_DEFENSE,
-            away_defense=SAMPLE_DEFENSE,
-            stadium_modifiers=SAMPLE_STADIUM["modifiers"],
-            seed=rng.randint(0, 1_000_000),
-            enable_organ_flair=True,
-        )
-
-        summary = game.play_game()
-        _record_standings(standings, summary, manager_state.team_name, "Rival Club")
-
-        _validate_crowd_modifiers(game.replay_log)
+    game_specs = [
+        {
+            "game_id": f"season-game-{game_index+1:03d}",
+            "home_team": manager_state.team_name,
+            "away_team": "Rival Club",
+            "home_lineup": home_rotations[game_index % series_length],
+            "away_lineup": away_rotations[game_index % series_length],
+            "seed": rng.randint(0, 1_000_000),
+        }
+        for game_index in range(games)
+    ]
+
+    # Optionally stream box scores to a sidecar JSONL as games finish rather
+    # than holding the whole season in memory until the final save.
+    box_score_log_context = (
+        BoxScoreLog.beside(season_state_path)
+        if stream_box_scores and season_state_path
+        else nullcontext()
+    )
+    with box_score_log_context as box_score_log:
+        results = _play_season_games(game_specs, workers)
+        for game_index, (summary, home_pitches, away_pitches) in enumerate(results):
+            home_pitcher_name = rotation[game_index % len(rotation)]
+            away_pitcher_name = away_rotation[game_index % len(away_rotation)]
 
-        home_pitches = _count_team_pitches(game.replay_log, batting_team="Rival Club")
-        away_pitches = _count_team_pitches(game.replay_log, batting_team=manager_state.team_name)
+            standings.record(summary, home_slot, away_slot)
 
-        fatigue_tracker[home_pitcher_name] += home_pitches
-        fatigue_tracker[away_pitcher_name] += away_pitches
+            fatigue_tracker[home_pitcher_name] += home_pitches
+            fatigue_tracker[away_pitcher_name] += away_pitches
 
-        for name in fatigue_tracker:
-            if name not in {home_pitcher_name, away_pitcher_name}:
+            # Everyone recovers whenever somebody besides today's starters sat out.
+            starters = 1 if home_pitcher_name == away_pitcher_name else 2
+            if len(fatigue_tracker) > starters:
                 _rest_rotation(fatigue_tracker, reset=False)
-                break
 
-        season_state.box_scores.append(summary)
+            if box_score_log is not None:
+                box_score_log.append(summary)
+            else:
+                season_state.box_scores.append(summary)
+
+            if (game_index + 1) % series_length == 0:
+                economics_log.append(_apply_series_economics(home_ledger, series_length))
+                economics_log.append(_apply_series_economics(away_ledger, series_length))
+                _rest_rotation(fatigue_tracker, reset=True)
+                if any(value != 0 for value in fatigue_tracker.values()):
+                    raise AssertionError("Fatigue failed to reset after rest period")
 
-        if (game_index + 1) % series_length == 0:
-            economics_log.append(_apply_series_economics(home_ledger, series_length))
-            economics_log.append(_apply_series_economics(away_ledger, series_length))
-            _rest_rotation(fatigue_tracker, reset=True)
-            if any(value != 0 for value in fatigue_tracker.values()):
-                raise AssertionError("Fatigue failed to reset after rest period")
+    if box_score_log is not None:
+        season_state.box_scores_log = box_score_log.path.name
 
     _rest_rotation(fatigue_tracker, reset=True)
     if any(value != 0 for value in fatigue_tracker.values()):
         raise AssertionError("Fatigue failed to reset after season wrap")
 
-    season_state.standings = list(standings.values())
+    season_state.standings = standings.to_standings()
     season_state.finances = {
         manager_state.team_id: home_ledger,
         "rival-club": away_ledger,
@@ -226,21 +307,24 @@ def run_simulated_season(
 
     if season_state_path:
         save_season_state(season_state, season_state_path)
+    if box_score_log is not None:
+        # Swap the sidecar in only once the state that references it is saved.
+        box_score_log.commit()
 
     return {
         "games": games,
         "series_length": series_length,
         "seed": seed,
         "economics": economics_log,
-        "standings": [asdict(entry) for entry in season_state.standings],
+        "standings": [entry.to_dict() for entry in season_state.standings],
         "finances": {
-            manager_state.team_id: _serialize_finances(home_ledger),
-            "rival-club": _serialize_finances(away_ledger),
+            manager_state.team_id: home_ledger.to_dict(),
+            "rival-club": away_ledger.to_dict(),
         },
     }
 
 
-def _parse_args() -> argparse.Namespace:
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Simulate a configurable stretch of the season")
     parser.add_argument("--games", type=int, default=DEFAULT_GAMES, help="Number of games to play")
     parser.add_argument(
@@ -263,7 +347,26 @@ def _parse_args() -> argparse.Namespace:
         default=Path("tmp/season_summary.json"),
         help="Where to write the high-level summary report",
     )
-    return parser.parse_args()
+    parser.add_argument("--pretty", action="store_true", help="Indent the summary report for human reading")
+    parser.add_argument(
+        "--stream-box-scores",
+        action="store_true",
+        help="Write box scores to a JSONL sidecar as games finish instead of embedding them",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes to play games in parallel (1 keeps everything in-process)",
+    )
+    return parser
+
+
+_PARSER = _build_parser()
+
+
+def _parse_args() -> argparse.Namespace:
+    return _PARSER.parse_args()
 
 
 def main() -> int:
@@ -274,10 +377,12 @@ def main() -> int:
         seed=args.seed,
         season_year=args.season_year,
         season_state_path=args.season_state_path,
+        workers=args.workers,
+        stream_box_scores=args.stream_box_scores,
     )
 
     args.summary.parent.mkdir(parents=True, exist_ok=True)
-    args.summary.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    args.summary.write_bytes(dumps(summary, indent=args.pretty))
 
     print(f"Simulated {summary['games']} games across series of {summary['series_length']}")
     print(f"Season state written to: {args.season_state_path}")
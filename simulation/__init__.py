@@ -1,54 +1,96 @@
-"""Simulation utilities for Peanuts and Crackerjacks."""
-
-from .crowd import CrowdEnergyAccumulator
-from .persistence import (
-    SEASON_STATE_VERSION,
-    BoxScoreSummary,
-    FinanceLedger,
-    SeasonState,
-    StadiumUpgrade,
-    TeamStanding,
-    apply_migrations,
-    load_season_state,
-    save_season_state,
-)
-from .pitch import PitchContext, PitchOutcome, PitchParticipants, resolve_pitch_outcome
-from .schemas import (
-    SCHEMA_VERSION,
-    SCHEMAS,
-    player_schema,
-    schedule_schema,
-    stadium_schema,
-    team_schema,
-)
-from .state import HalfInningState, PitchEvent
-from .fixtures import SAMPLE_PITCHER, SAMPLE_BATTER, SAMPLE_DEFENSE, SAMPLE_STADIUM
-
-__all__ = [
-    "resolve_pitch_outcome",
-    "PitchParticipants",
-    "PitchContext",
-    "PitchOutcome",
-    "HalfInningState",
-    "PitchEvent",
-    "CrowdEnergyAccumulator",
-    "SCHEMA_VERSION",
-    "SCHEMAS",
-    "player_schema",
-    "team_schema",
-    "stadium_schema",
-    "schedule_schema",
-    "SEASON_STATE_VERSION",
-    "SeasonState",
-    "TeamStanding",
-    "BoxScoreSummary",
-    "FinanceLedger",
-    "StadiumUpgrade",
-    "save_season_state",
-    "load_season_state",
-    "apply_migrations",
-    "SAMPLE_PITCHER",
-    "SAMPLE_BATTER",
-    "SAMPLE_DEFENSE",
-    "SAMPLE_STADIUM",
-]
+"""Simulation utilities for Peanuts and Crackerjacks.
+
+Public names are re-exported lazily (PEP 562) so that importing one submodule,
+such as ``simulation.cli``, does not pull in every other module in the package.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:  # pragma: no cover - static re-exports for type checkers
+    from .crowd import CrowdEnergyAccumulator
+    from .persistence import (
+        SEASON_STATE_VERSION,
+        BoxScoreLog,
+        BoxScoreSummary,
+        FinanceLedger,
+        SeasonState,
+        StadiumUpgrade,
+        TeamStanding,
+        apply_migrations,
+        load_season_state,
+        register_migration,
+        save_season_state,
+    )
+    from .pitch import (
+        OutcomeCode,
+        PitchContext,
+        PitchOutcome,
+        PitchParticipants,
+        resolve_pitch_outcome,
+        resolve_pitch_outcomes,
+    )
+    from .schemas import (
+        SCHEMA_VERSION,
+        SCHEMAS,
+        get_validator,
+        player_schema,
+        schedule_schema,
+        stadium_schema,
+        team_schema,
+    )
+    from .state import HalfInningState, PitchEvent
+    from .fixtures import SAMPLE_PITCHER, SAMPLE_BATTER, SAMPLE_DEFENSE, SAMPLE_STADIUM
+
+_LAZY_EXPORTS: Dict[str, str] = {
+    "resolve_pitch_outcome": ".pitch",
+    "resolve_pitch_outcomes": ".pitch",
+    "PitchParticipants": ".pitch",
+    "PitchContext": ".pitch",
+    "PitchOutcome": ".pitch",
+    "OutcomeCode": ".pitch",
+    "HalfInningState": ".state",
+    "PitchEvent": ".state",
+    "CrowdEnergyAccumulator": ".crowd",
+    "SCHEMA_VERSION": ".schemas",
+    "SCHEMAS": ".schemas",
+    "get_validator": ".schemas",
+    "player_schema": ".schemas",
+    "team_schema": ".schemas",
+    "stadium_schema": ".schemas",
+    "schedule_schema": ".schemas",
+    "SEASON_STATE_VERSION": ".persistence",
+    "SeasonState": ".persistence",
+    "TeamStanding": ".persistence",
+    "BoxScoreSummary": ".persistence",
+    "BoxScoreLog": ".persistence",
+    "FinanceLedger": ".persistence",
+    "StadiumUpgrade": ".persistence",
+    "save_season_state": ".persistence",
+    "load_season_state": ".persistence",
+    "apply_migrations": ".persistence",
+    "register_migration": ".persistence",
+    "SAMPLE_PITCHER": ".fixtures",
+    "SAMPLE_BATTER": ".fixtures",
+    "SAMPLE_DEFENSE": ".fixtures",
+    "SAMPLE_STADIUM": ".fixtures",
+}
+
+__all__: List[str] = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,34 @@
+"""Read-only mapping shared by pitch events that carry the same modifiers."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, NoReturn, Tuple, Type
+
+
+class FrozenDict(dict):
+    """``dict`` that rejects in-place changes, so one instance can be shared.
+
+    It stays a real ``dict`` subclass, so orjson, :mod:`json` and
+    ``dataclasses.asdict`` treat it like any other mapping. ``dict(frozen)``
+    returns a mutable copy.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(f"{type(self).__name__} is read-only; copy it with dict() to change it")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self) -> "FrozenDict":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "FrozenDict":
+        return self
+
+    def __reduce__(self) -> Tuple[Type["FrozenDict"], Tuple[Dict[Any, Any]]]:
+        return type(self), (dict(self),)
+
+
+__all__ = ["FrozenDict"]
@@ -0,0 +1,73 @@
+"""JSON helpers shared by the CLI, persistence layer, and dev scripts.
+
+``orjson`` is used when it is installed; otherwise the stdlib encoder produces
+the same document shape. Both paths exchange UTF-8 ``bytes`` so callers can
+write straight to disk without an intermediate ``str``.
+"""
+
+from __future__ import annotations
+
+import json
+from array import array
+from dataclasses import asdict, is_dataclass
+from typing import Any, BinaryIO
+
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, array):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(payload: Any, *, indent: bool = False) -> bytes:
+    """Encode ``payload`` to compact UTF-8 JSON bytes, or two-space indented with ``indent``."""
+
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(payload, default=_default, option=option)
+
+    if indent:
+        text = json.dumps(payload, indent=2, ensure_ascii=False, default=_default)
+    else:
+        text = json.dumps(payload, separators=(",", ":"), ensure_ascii=False, default=_default)
+    return text.encode("utf-8")
+
+
+def dump(payload: Any, handle: BinaryIO, *, indent: bool = False) -> None:
+    """Write ``payload`` to a binary ``handle`` in the same format as :func:`dumps`.
+
+    The stdlib fallback streams encoder chunks rather than building the whole
+    document first, so pair it with a buffered handle.
+    """
+
+    if orjson is not None:
+        handle.write(dumps(payload, indent=indent))
+        return
+
+    if indent:
+        encoder = json.JSONEncoder(indent=2, ensure_ascii=False, default=_default)
+    else:
+        encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=_default)
+    write = handle.write
+    for chunk in encoder.iterencode(payload):
+        write(chunk.encode("utf-8"))
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode a JSON document from ``bytes`` or ``str``."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+__all__ = ["dump", "dumps", "loads"]
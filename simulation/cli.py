@@ -3,23 +3,45 @@
 from __future__ import annotations
 
 import argparse
-import json
-from pathlib import Path
-from typing import List
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
+from ._json import dump, dumps
 from .fixtures import SAMPLE_BATTER, SAMPLE_DEFENSE, SAMPLE_PITCHER, SAMPLE_STADIUM
+from .persistence import WRITE_BUFFER_SIZE, BoxScoreSummary, SeasonState, save_season_state
 from .state import GameState, HalfInningState
 
 
-def build_lineup(size: int = 3) -> List[dict]:
-    return [SAMPLE_BATTER for _ in range(size)]
+def build_lineup(size: int = 3) -> Tuple[dict, ...]:
+    # Every slot is the same read-only sample batter, so share one reference.
+    return (SAMPLE_BATTER,) * size
 
 
-def main() -> None:
+def _emit_json(payload: object, *, pretty: bool = False) -> None:
+    """Write ``payload`` to stdout as encoded bytes, skipping the text layer.
+
+    Text-only streams such as ``contextlib.redirect_stdout(io.StringIO())``
+    have no ``buffer``, so they get the decoded document instead.
+    """
+
+    encoded = dumps(payload, indent=pretty) + b"\n"
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(encoded.decode("utf-8"))
+        return
+    sys.stdout.flush()
+    buffer.write(encoded)
+    buffer.flush()
+
+
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Run a sample half-inning simulation")
     parser.add_argument("--seed", type=int, default=None, help="Random seed for deterministic output")
     parser.add_argument("--max-pitches", type=int, default=120, help="Fail-safe pitch cap")
     parser.add_argument("--json", action="store_true", help="Emit JSON replay data instead of text")
+    parser.add_argument("--pretty", action="store_true", help="Indent JSON output and the replay log for human reading")
     parser.add_argument("--full-game", action="store_true", help="Play a full game instead of a half-inning")
     parser.add_argument("--game-id", type=str, default="sample-game", help="Identifier to tag the box score")
     parser.add_argument("--home-team", type=str, default="Home Team", help="Label for the home team")
@@ -27,6 +49,13 @@ def main() -> None:
     parser.add_argument("--lineup-size", type=int, default=3, help="Number of batters to include in each lineup")
     parser.add_argument("--max-innings", type=int, default=9, help="Regulation innings to schedule")
     parser.add_argument("--max-extra-innings", type=int, default=3, help="Cap on extra innings before declaring a draw")
+    parser.add_argument(
+        "--num-games",
+        type=int,
+        default=1,
+        help="With --full-game, play this many independent games seeded from --seed",
+    )
+    parser.add_argument("--workers", type=int, default=1, help="Processes used to play --num-games in parallel")
     parser.add_argument("--season-year", type=int, default=0, help="Season year to stamp in persisted box scores")
     parser.add_argument(
         "--season-state-path",
@@ -55,52 +84,135 @@ def main() -> None:
         action="store_true",
         help="Allow the optional organ agent to add small situational boosts",
     )
-    args = parser.parse_args()
+    return parser
 
-    lineup = build_lineup(args.lineup_size)
 
-    if args.full_game:
-        game = GameState(
-            game_id=args.game_id,
-            home_team=args.home_team,
-            away_team=args.away_team,
-            home_lineup=lineup,
-            away_lineup=build_lineup(args.lineup_size),
-            home_pitcher=SAMPLE_PITCHER["ratings"],
-            away_pitcher=SAMPLE_PITCHER["ratings"],
-            home_defense=SAMPLE_DEFENSE,
-            away_defense=SAMPLE_DEFENSE,
-            stadium_modifiers=SAMPLE_STADIUM["modifiers"],
-            seed=args.seed,
-            max_innings=args.max_innings,
-            max_extra_innings=args.max_extra_innings,
-            max_half_inning_pitches=args.max_pitches,
-            enable_crowd_effects=not args.disable_crowd_effects,
-            enable_stadium_effects=not args.disable_stadium_effects,
-            enable_organ_flair=args.enable_organ_flair,
-        )
+def _game_config(args: argparse.Namespace, *, game_id: str, seed: Optional[int]) -> Dict[str, object]:
+    """Collect the ``GameState`` keyword arguments described by parsed CLI options."""
+
+    return {
+        "game_id": game_id,
+        "home_team": args.home_team,
+        "away_team": args.away_team,
+        "home_lineup": build_lineup(args.lineup_size),
+        "away_lineup": build_lineup(args.lineup_size),
+        "home_pitcher": SAMPLE_PITCHER["ratings"],
+        "away_pitcher": SAMPLE_PITCHER["ratings"],
+        "home_defense": SAMPLE_DEFENSE,
+        "away_defense": SAMPLE_DEFENSE,
+        "stadium_modifiers": SAMPLE_STADIUM["modifiers"],
+        "seed": seed,
+        "max_innings": args.max_innings,
+        "max_extra_innings": args.max_extra_innings,
+        "max_half_inning_pitches": args.max_pitches,
+        "enable_crowd_effects": not args.disable_crowd_effects,
+        "enable_stadium_effects": not args.disable_stadium_effects,
+        "enable_organ_flair": args.enable_organ_flair,
+    }
+
+
+def run_full_game(args: argparse.Namespace) -> BoxScoreSummary:
+    """Play a full game from parsed CLI options, writing any requested artifacts.
+
+    This is the in-process entry point behind ``--full-game`` so harnesses can
+    skip spawning a fresh interpreter per run.
+    """
+
+    game = GameState(**_game_config(args, game_id=args.game_id, seed=args.seed))
+
+    summary = game.play_game()
+
+    if args.replay_log:
+        with open(args.replay_log, "wb", buffering=WRITE_BUFFER_SIZE) as handle:
+            dump(game.as_replay_payload(), handle, indent=args.pretty)
+
+    if args.season_state_path:
+        game.persist_box_score(season_year=args.season_year, destination=args.season_state_path)
+
+    return summary
+
 
-        summary = game.play_game()
+def _run_one_game(config: Dict[str, object]) -> BoxScoreSummary:
+    # Module scope so worker processes can unpickle it. Only the box score
+    # leaves the worker, so skip recording the per-pitch replay.
+    return GameState(**config, record_replay=False).play_game()
 
+
+def run_many(args: argparse.Namespace) -> List[BoxScoreSummary]:
+    """Play ``--num-games`` independent games, fanning out over ``--workers`` processes.
+
+    Per-game seeds are drawn up front from ``--seed``, so the summaries come back
+    in schedule order and match a single-process run. With
+    ``--season-state-path`` every box score is persisted in one ``SeasonState``.
+    """
+
+    rng = random.Random(args.seed)
+    configs = [
+        _game_config(args, game_id=f"{args.game_id}-{number:03d}", seed=rng.randint(0, 1_000_000))
+        for number in range(1, args.num_games + 1)
+    ]
+
+    if args.workers <= 1:
+        summaries = list(map(_run_one_game, configs))
+    else:
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            summaries = list(executor.map(_run_one_game, configs))
+
+    if args.season_state_path:
+        state = SeasonState.empty(args.season_year)
+        state.box_scores.extend(summaries)
+        save_season_state(state, args.season_state_path)
+
+    return summaries
+
+
+_PARSER = build_parser()
+
+
+def main() -> None:
+    args = _PARSER.parse_args()
+
+    if args.num_games < 1:
+        _PARSER.error("--num-games must be at least 1")
+    if args.workers < 1:
+        _PARSER.error("--workers must be at least 1")
+
+    if args.num_games > 1:
+        if not args.full_game:
+            _PARSER.error("--num-games requires --full-game")
         if args.replay_log:
-            Path(args.replay_log).write_text(json.dumps(game.as_replay_payload(), indent=2), encoding="utf-8")
+            _PARSER.error("--replay-log records a single game; drop it when using --num-games")
+
+        summaries = run_many(args)
+
+        if args.json:
+            _emit_json([summary.to_dict() for summary in summaries], pretty=args.pretty)
+            return
 
-        if args.season_state_path:
-            game.persist_box_score(season_year=args.season_year, destination=args.season_state_path)
+        for summary in summaries:
+            print(
+                f"{summary.game_id}: {args.away_team} {summary.away_score} - "
+                f"{args.home_team} {summary.home_score}"
+            )
+        return
+
+    if args.full_game:
+        summary = run_full_game(args)
 
         if args.json:
-            print(json.dumps(summary.to_dict(), indent=2))
+            _emit_json(summary.to_dict(), pretty=args.pretty)
             return
 
         print(f"Game: {args.away_team} at {args.home_team} ({args.game_id})")
         print(f"Stadium: {SAMPLE_STADIUM['name']}")
         print("---")
-        for idx, (away_runs, home_runs) in enumerate(summary.inning_lines, start=1):
+        for idx, (away_runs, home_runs) in enumerate(summary.innings(), start=1):
             print(f"Inning {idx:02d} | Away {away_runs} | Home {home_runs}")
         print("---")
         print(f"Final: {args.away_team} {summary.away_score} - {args.home_team} {summary.home_score}")
         return
 
+    lineup = build_lineup(args.lineup_size)
     state = HalfInningState(
         lineup=lineup,
         defense=SAMPLE_DEFENSE,
@@ -112,17 +224,17 @@ def main() -> None:
         enable_organ_flair=args.enable_organ_flair,
     )
 
-    state.play_to_completion(max_pitches=args.max_pitches)
+    events = state.play_to_completion(max_pitches=args.max_pitches)
 
     if args.json:
-        print(json.dumps(state.replay_log, indent=2))
+        _emit_json(list(state.replay_log), pretty=args.pretty)
         return
 
     print(f"Stadium: {SAMPLE_STADIUM['name']}")
     print(f"Pitcher: {SAMPLE_PITCHER['name']}")
     print(f"Lineup: {[p['name'] for p in lineup]}")
     print("---")
-    for event in state.events:
+    for event in events:
         pre_count = f"{event.balls_before}-{event.strikes_before}"
         post_count = f"{event.balls_after}-{event.strikes_after}"
         bases_before = "".join(["1" if base else "-" for base in event.bases_before])
@@ -3,14 +3,27 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Optional
 
+from ._frozen import FrozenDict
 
-def _clamp(value: float, low: float, high: float) -> float:
-    return max(low, min(high, value))
 
+# Energy swing per applied pitch result; anything unlisted leaves the crowd be.
+_OUTCOME_SWING_BONUS: Dict[str, float] = {
+    "single": 6.0,
+    "double": 6.0,
+    "triple": 6.0,
+    "homerun": 12.0,
+    "walk": 2.5,
+    "called_strike": -2.5,
+    "swinging_strike": -2.5,
+    "strikeout": -2.5,
+    "inplay_out": -2.5,
+    "foul": -2.5,
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class CrowdEnergySnapshot:
     energy: float
     modifiers: Dict[str, float]
@@ -30,14 +43,18 @@ class CrowdEnergyAccumulator:
         self.max_energy = max_energy
         self.decay_rate = decay_rate
         self.modifier_cap = modifier_cap
-        self._last_modifiers: Dict[str, float] = {}
+        # Read-only so pitch events can share the memoized modifiers directly.
+        self._last_modifiers: Dict[str, float] = FrozenDict()
+        # Energy the cached modifiers were built from; the floor and ceiling
+        # clamps often leave energy unchanged across consecutive pitches.
+        self._modifiers_energy: Optional[float] = None
+        self._snapshot: Optional[CrowdEnergySnapshot] = None
 
     def tick(self) -> CrowdEnergySnapshot:
         """Apply decay and surface the latest modifiers."""
         decayed = self.energy * (1 - self.decay_rate)
-        self.energy = _clamp(decayed, 0.0, self.max_energy)
-        self._last_modifiers = self._build_modifiers()
-        return CrowdEnergySnapshot(energy=self.energy, modifiers=self._last_modifiers)
+        self.energy = 0.0 if decayed < 0.0 else (self.max_energy if decayed > self.max_energy else decayed)
+        return self.snapshot()
 
     def apply_event(self, outcome: str, runs_scored: int, contact_quality: float) -> CrowdEnergySnapshot:
         """Adjust energy in response to a pitch outcome.
@@ -45,35 +62,38 @@ class CrowdEnergyAccumulator:
         Celebratory events add momentum while outs and weak contact bleed it off.
         """
 
-        swing_bonus = 0.0
+        swing_bonus = _OUTCOME_SWING_BONUS.get(outcome, 0.0) + contact_quality * 0.02
         scoring_bonus = runs_scored * 6.0
 
-        if outcome in {"single", "double", "triple"}:
-            swing_bonus = 6.0
-        elif outcome == "homerun":
-            swing_bonus = 12.0
-        elif outcome == "walk":
-            swing_bonus = 2.5
-        elif outcome in {"called_strike", "swinging_strike", "strikeout", "inplay_out", "foul"}:
-            swing_bonus = -2.5
-
-        swing_bonus += contact_quality * 0.02
+        energy = self.energy + swing_bonus + scoring_bonus
+        self.energy = 0.0 if energy < 0.0 else (self.max_energy if energy > self.max_energy else energy)
+        return self.snapshot()
 
-        self.energy = _clamp(self.energy + swing_bonus + scoring_bonus, 0.0, self.max_energy)
-        self._last_modifiers = self._build_modifiers()
-        return CrowdEnergySnapshot(energy=self.energy, modifiers=self._last_modifiers)
+    def _refresh_modifiers(self) -> None:
+        if self.energy != self._modifiers_energy:
+            self._last_modifiers = self._build_modifiers()
+            self._modifiers_energy = self.energy
 
     def _build_modifiers(self) -> Dict[str, float]:
         momentum = self.energy / self.max_energy
-        return {
-            "global": self._bounded_modifier(0.04 * momentum),
-            "contact": self._bounded_modifier(0.05 * momentum),
-            "power": self._bounded_modifier(0.06 * momentum),
-            "aggression": self._bounded_modifier(0.02 * momentum),
-        }
+        return FrozenDict(
+            {
+                "global": self._bounded_modifier(0.04 * momentum),
+                "contact": self._bounded_modifier(0.05 * momentum),
+                "power": self._bounded_modifier(0.06 * momentum),
+                "aggression": self._bounded_modifier(0.02 * momentum),
+            }
+        )
 
     def _bounded_modifier(self, raw_value: float) -> float:
-        return _clamp(raw_value, -self.modifier_cap, self.modifier_cap)
+        cap = self.modifier_cap
+        return -cap if raw_value < -cap else (cap if raw_value > cap else raw_value)
 
     def snapshot(self) -> CrowdEnergySnapshot:
-        return CrowdEnergySnapshot(energy=self.energy, modifiers=self._last_modifiers or self._build_modifiers())
+        # Builds and keeps the modifiers and snapshot on first use, then serves
+        # the cached instance until energy moves; treat it as read-only.
+        self._refresh_modifiers()
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.energy != self.energy or snapshot.modifiers is not self._last_modifiers:
+            snapshot = self._snapshot = CrowdEnergySnapshot(energy=self.energy, modifiers=self._last_modifiers)
+        return snapshot
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, MutableMapping
+from typing import Dict, List, MutableMapping, Tuple
 
+from ._json import loads
 from .persistence import FinanceLedger
 
 DEFAULT_BRIDGE_PATH = Path(__file__).resolve().parent.parent / "web" / "manager_state.json"
@@ -69,15 +69,34 @@ def _team_from_payload(payload: MutableMapping[str, object]) -> Dict[str, object
     }
 
 
+# Parsed bridge files keyed by path, tagged with the (mtime_ns, size) they were
+# read at. Callers get a freshly built state each time, so the cached payload
+# is never handed out for mutation.
+_BRIDGE_CACHE: Dict[Path, Tuple[Tuple[int, int], MutableMapping[str, object]]] = {}
+
+
+def _read_bridge_payload(path: Path) -> MutableMapping[str, object]:
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _BRIDGE_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    payload: MutableMapping[str, object] = loads(path.read_bytes())
+    _BRIDGE_CACHE[path] = (stamp, payload)
+    return payload
+
+
 def load_management_state(path: Path | str = DEFAULT_BRIDGE_PATH) -> ManagementBridgeState:
     """Load a manager sync file and expose FinanceLedger and roster payloads.
 
     The management UI exports ``manager_state.json`` beside the web assets. This
     helper is meant to be invoked before each game so the simulator consumes the
     latest lineup, rotation, ticket pricing, promotions, and concessions values.
+    The parsed file is cached until its modification time or size changes.
     """
 
-    payload: MutableMapping[str, object] = json.loads(Path(path).read_text(encoding="utf-8"))
+    payload = _read_bridge_payload(Path(path))
     team = _team_from_payload(payload)
     ledger = _finance_from_payload(payload)
 
@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass, asdict
+import os
+from array import array
+from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
-from typing import Callable, Dict, List, MutableMapping, Optional
+from typing import BinaryIO, Callable, Dict, Iterator, List, MutableMapping, Optional, Tuple
+
+from ._json import dump, dumps, loads
 
 SEASON_STATE_VERSION = "1.0.0"
 
+WRITE_BUFFER_SIZE = 1 << 18
+
 Migration = Callable[[MutableMapping[str, object]], MutableMapping[str, object]]
 
 
-@dataclass
+@dataclass(slots=True)
 class TeamStanding:
     team_id: str
     wins: int
@@ -21,7 +27,13 @@ class TeamStanding:
     runs_against: int = 0
 
     def to_dict(self) -> Dict[str, object]:
-        return asdict(self)
+        return {
+            "team_id": self.team_id,
+            "wins": self.wins,
+            "losses": self.losses,
+            "runs_for": self.runs_for,
+            "runs_against": self.runs_against,
+        }
 
     @classmethod
     def from_dict(cls, data: MutableMapping[str, object]) -> "TeamStanding":
@@ -34,19 +46,39 @@ class TeamStanding:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class BoxScoreSummary:
     game_id: str
     home_team: str
     away_team: str
     home_score: int
     away_score: int
-    inning_lines: Optional[List[List[int]]] = None
+    # Flat run totals, one away/home pair per inning. Row-shaped input such as
+    # ``[[away, home], ...]`` is accepted and flattened on construction; read
+    # rows back through :meth:`innings` or :meth:`to_dict`.
+    inning_lines: Optional[array] = None
+
+    def __post_init__(self) -> None:
+        if self.inning_lines is not None and not isinstance(self.inning_lines, array):
+            self.inning_lines = array("i", chain.from_iterable(self.inning_lines))
+
+    def innings(self) -> Iterator[Tuple[int, int]]:
+        """Yield ``(away_runs, home_runs)`` for each inning played."""
+
+        lines = self.inning_lines
+        if not lines:
+            return iter(())
+        return zip(lines[0::2], lines[1::2])
 
     def to_dict(self) -> Dict[str, object]:
-        payload = asdict(self)
-        payload["inning_lines"] = self.inning_lines or []
-        return payload
+        return {
+            "game_id": self.game_id,
+            "home_team": self.home_team,
+            "away_team": self.away_team,
+            "home_score": self.home_score,
+            "away_score": self.away_score,
+            "inning_lines": [[away, home] for away, home in self.innings()],
+        }
 
     @classmethod
     def from_dict(cls, data: MutableMapping[str, object]) -> "BoxScoreSummary":
@@ -56,11 +88,65 @@ class BoxScoreSummary:
             away_team=str(data["away_team"]),
             home_score=int(data.get("home_score", 0)),
             away_score=int(data.get("away_score", 0)),
-            inning_lines=[list(map(int, row)) for row in data.get("inning_lines", [])],
+            inning_lines=array(
+                "i", map(int, chain.from_iterable(data.get("inning_lines", [])))
+            ),
         )
 
 
-@dataclass
+class _AmountMap(dict):
+    """``dict`` of amounts that caches the sum of its values until it is modified."""
+
+    _total: Optional[float] = None
+
+    @property
+    def total(self) -> float:
+        total = self._total
+        if total is None:
+            total = self._total = sum(self.values())
+        return total
+
+    def __setitem__(self, key: str, value: float) -> None:
+        dict.__setitem__(self, key, value)
+        self._total = None
+
+    def __delitem__(self, key: str) -> None:
+        dict.__delitem__(self, key)
+        self._total = None
+
+    def __ior__(self, other: object) -> "_AmountMap":
+        dict.update(self, other)
+        self._total = None
+        return self
+
+    def clear(self) -> None:
+        dict.clear(self)
+        self._total = None
+
+    def pop(self, *args: object) -> object:
+        self._total = None
+        return dict.pop(self, *args)
+
+    def popitem(self) -> Tuple[str, float]:
+        self._total = None
+        return dict.popitem(self)
+
+    def setdefault(self, key: str, default: float = 0.0) -> float:
+        self._total = None
+        return dict.setdefault(self, key, default)
+
+    def update(self, *args: object, **kwargs: float) -> None:
+        dict.update(self, *args, **kwargs)
+        self._total = None
+
+
+def _amounts_total(amounts: Dict[str, float]) -> float:
+    if isinstance(amounts, _AmountMap):
+        return amounts.total
+    return sum(amounts.values())
+
+
+@dataclass(slots=True)
 class FinanceLedger:
     cash_on_hand: float
     revenue: Dict[str, float]
@@ -69,8 +155,38 @@ class FinanceLedger:
     promotions: List[str]
     concessions_pricing: Dict[str, float]
 
+    def __post_init__(self) -> None:
+        # The mappings become _AmountMaps, which keep their sums until edited,
+        # so each series reads the totals without rescanning the dicts. A plain
+        # dict assigned later is summed on every read instead.
+        for name in ("revenue", "expenses", "concessions_pricing"):
+            amounts = getattr(self, name)
+            if not isinstance(amounts, _AmountMap):
+                setattr(self, name, _AmountMap(amounts))
+
+    @property
+    def recurring_revenue(self) -> float:
+        return _amounts_total(self.revenue)
+
+    @property
+    def recurring_expenses(self) -> float:
+        return _amounts_total(self.expenses)
+
+    @property
+    def concessions_total(self) -> float:
+        return _amounts_total(self.concessions_pricing)
+
     def to_dict(self) -> Dict[str, object]:
-        return asdict(self)
+        # One-level copies keep callers from aliasing the ledger's mappings
+        # without the recursive deepcopy that ``asdict`` performs.
+        return {
+            "cash_on_hand": self.cash_on_hand,
+            "revenue": dict(self.revenue),
+            "expenses": dict(self.expenses),
+            "ticket_price": self.ticket_price,
+            "promotions": list(self.promotions),
+            "concessions_pricing": dict(self.concessions_pricing),
+        }
 
     @classmethod
     def from_dict(cls, data: MutableMapping[str, object]) -> "FinanceLedger":
@@ -86,7 +202,7 @@ class FinanceLedger:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class StadiumUpgrade:
     name: str
     level: int
@@ -94,7 +210,7 @@ class StadiumUpgrade:
     cost: float
 
     def to_dict(self) -> Dict[str, object]:
-        return asdict(self)
+        return {"name": self.name, "level": self.level, "effect": self.effect, "cost": self.cost}
 
     @classmethod
     def from_dict(cls, data: MutableMapping[str, object]) -> "StadiumUpgrade":
@@ -106,7 +222,7 @@ class StadiumUpgrade:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SeasonState:
     """Bundle the season state for persistence and migration."""
 
@@ -117,9 +233,12 @@ class SeasonState:
     stadium_upgrades: Dict[str, List[StadiumUpgrade]]
     concessions_pricing: Dict[str, Dict[str, float]]
     version: str = SEASON_STATE_VERSION
+    # File name of a JSONL sidecar, next to the state file, holding further box
+    # scores streamed out by :class:`BoxScoreLog` while the season was played.
+    box_scores_log: Optional[str] = None
 
     def to_dict(self) -> Dict[str, object]:
-        return {
+        payload: Dict[str, object] = {
             "version": self.version,
             "season_year": self.season_year,
             "standings": [team.to_dict() for team in self.standings],
@@ -134,6 +253,9 @@ class SeasonState:
                 for team, pricing in self.concessions_pricing.items()
             },
         }
+        if self.box_scores_log:
+            payload["box_scores_log"] = self.box_scores_log
+        return payload
 
     @classmethod
     def from_dict(cls, data: MutableMapping[str, object]) -> "SeasonState":
@@ -154,6 +276,7 @@ class SeasonState:
                 for team, pricing in dict(data.get("concessions_pricing", {})).items()
             },
             version=str(data.get("version", SEASON_STATE_VERSION)),
+            box_scores_log=data.get("box_scores_log") or None,
         )
 
     @classmethod
@@ -168,37 +291,154 @@ class SeasonState:
         )
 
 
+class BoxScoreLog:
+    """Append-only JSONL sink that writes box scores as games complete.
+
+    Lines go to ``<path>.tmp`` and only replace :attr:`path` on :meth:`commit`,
+    so an interrupted season never truncates the sidecar an earlier save still
+    points at. Point :attr:`SeasonState.box_scores_log` at :attr:`path`'s name,
+    save the state, then commit; :func:`load_season_state` reads the lines back
+    into ``box_scores``. Leaving the ``with`` block on an exception discards
+    the partial log.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.count = 0
+        self._pending = self.path.with_name(f"{self.path.name}.tmp")
+        self._handle: BinaryIO = open(self._pending, "wb")
+
+    @classmethod
+    def beside(cls, state_path: Path | str) -> "BoxScoreLog":
+        """Open the conventional sidecar log for the season state at ``state_path``."""
+
+        destination = Path(state_path)
+        return cls(destination.with_name(f"{destination.stem}.box_scores.jsonl"))
+
+    def append(self, summary: BoxScoreSummary) -> None:
+        self._handle.write(dumps(summary.to_dict()) + b"\n")
+        self.count += 1
+
+    def close(self) -> None:
+        self._handle.close()
+
+    def commit(self) -> Path:
+        """Move the finished log into place at :attr:`path`."""
+
+        self.close()
+        os.replace(self._pending, self.path)
+        return self.path
+
+    def __enter__(self) -> "BoxScoreLog":
+        return self
+
+    def __exit__(self, exc_type: object, *exc_info: object) -> None:
+        self.close()
+        if exc_type is not None:
+            self._pending.unlink(missing_ok=True)
+
+
+def _read_box_score_log(path: Path) -> List[BoxScoreSummary]:
+    with open(path, "rb") as handle:
+        return [BoxScoreSummary.from_dict(loads(line)) for line in handle if line.strip()]
+
+
 MIGRATIONS: Dict[str, Migration] = {}
 
+# Declared result version for each migration added via ``register_migration``,
+# and the straight-line plans compiled from them per starting version.
+_MIGRATION_TARGETS: Dict[str, str] = {}
+_MIGRATION_PLANS: Dict[str, Tuple[Migration, ...]] = {}
+
+
+def register_migration(from_version: str, to_version: str) -> Callable[[Migration], Migration]:
+    """Register the decorated function to upgrade ``from_version`` payloads to ``to_version``."""
+
+    def decorator(migration: Migration) -> Migration:
+        MIGRATIONS[from_version] = migration
+        _MIGRATION_TARGETS[from_version] = to_version
+        _MIGRATION_PLANS.clear()
+        return migration
+
+    return decorator
+
+
+def _migration_plan(version: str) -> Tuple[Migration, ...]:
+    plan = _MIGRATION_PLANS.get(version)
+    if plan is None:
+        steps: List[Migration] = []
+        start = version
+        while version in _MIGRATION_TARGETS and len(steps) <= len(_MIGRATION_TARGETS):
+            steps.append(MIGRATIONS[version])
+            version = _MIGRATION_TARGETS[version]
+        plan = _MIGRATION_PLANS[start] = tuple(steps)
+    return plan
+
 
 def apply_migrations(raw: MutableMapping[str, object]) -> MutableMapping[str, object]:
     """Iteratively upgrade payloads using registered migration handlers."""
 
     current_version = str(raw.get("version", "0.0.0"))
+    plan = _migration_plan(current_version)
+    if plan:
+        for migration in plan:
+            raw = migration(raw)
+        current_version = str(raw.get("version", current_version))
+
+    # Handlers assigned straight into MIGRATIONS declare no target version, so
+    # any remaining hops are discovered one payload at a time.
     while current_version in MIGRATIONS:
         raw = MIGRATIONS[current_version](raw)
         current_version = str(raw.get("version", current_version))
     return raw
 
 
-def save_season_state(state: SeasonState, path: Path | str) -> Path:
-    """Persist the provided ``SeasonState`` to disk with a version tag."""
+def save_season_state(state: SeasonState, path: Path | str, *, binary: bool = False) -> Path:
+    """Persist the provided ``SeasonState`` to disk with a version tag.
+
+    With ``binary=True`` the box scores go to a compact ``<stem>.box_scores.bin``
+    sidecar (see :mod:`simulation.persistence_binary`) instead of the JSON body.
+    """
 
     payload = state.to_dict()
     payload.setdefault("version", SEASON_STATE_VERSION)
 
     destination = Path(path)
     destination.parent.mkdir(parents=True, exist_ok=True)
-    destination.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    if binary:
+        from .persistence_binary import write_box_scores
+
+        sidecar = write_box_scores(
+            destination.with_name(f"{destination.stem}.box_scores.bin"), state.box_scores
+        )
+        payload["box_scores"] = []
+        payload["box_scores_bin"] = sidecar.name
+    # Stream the encoded document through a large buffer rather than building
+    # the whole indented text first.
+    with open(destination, "wb", buffering=WRITE_BUFFER_SIZE) as handle:
+        dump(payload, handle, indent=True)
     return destination
 
 
 def load_season_state(path: Path | str) -> SeasonState:
     """Load a ``SeasonState`` from disk, applying migrations when required."""
 
-    raw_payload: MutableMapping[str, object] = json.loads(Path(path).read_text(encoding="utf-8"))
+    source = Path(path)
+    raw_payload: MutableMapping[str, object] = loads(source.read_bytes())
     migrated = apply_migrations(raw_payload)
-    return SeasonState.from_dict(migrated)
+    state = SeasonState.from_dict(migrated)
+
+    if migrated.get("box_scores_bin"):
+        from .persistence_binary import read_box_scores
+
+        state.box_scores.extend(read_box_scores(source.with_name(str(migrated["box_scores_bin"]))))
+
+    if state.box_scores_log:
+        # Materialize streamed box scores so a re-save embeds them directly.
+        state.box_scores.extend(_read_box_score_log(source.with_name(state.box_scores_log)))
+        state.box_scores_log = None
+    return state
 
 
 __all__ = [
@@ -208,7 +448,9 @@ __all__ = [
     "FinanceLedger",
     "StadiumUpgrade",
     "SeasonState",
+    "BoxScoreLog",
     "apply_migrations",
+    "register_migration",
     "save_season_state",
     "load_season_state",
 ]
@@ -0,0 +1,115 @@
+"""Compact binary encoding for season box scores.
+
+Box scores are fixed-shape records, so a season's worth packs far smaller and
+faster as ``struct`` records than as indented JSON. The layout is little-endian:
+
+* header: ``b"PBOX"``, format version (uint16), string count (uint32), record
+  count (uint32)
+* string table: per entry, byte length (uint16) then UTF-8 bytes
+* records: game id, home team and away team string indexes (uint32 each), home
+  and away score (uint16 each), inning count (uint16), then ``2 * innings``
+  int16 run totals as away/home pairs
+"""
+
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+from .persistence import WRITE_BUFFER_SIZE, BoxScoreSummary
+
+MAGIC = b"PBOX"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<4sHII")
+_STRING_LENGTH = struct.Struct("<H")
+_RECORD = struct.Struct("<IIIHHH")
+
+
+def _little_endian(runs: array) -> bytes:
+    if sys.byteorder != "little":
+        runs = array(runs.typecode, runs)
+        runs.byteswap()
+    return runs.tobytes()
+
+
+def write_box_scores(path: Path | str, box_scores: Iterable[BoxScoreSummary]) -> Path:
+    """Write ``box_scores`` to ``path`` in the binary layout described above."""
+
+    strings: Dict[str, int] = {}
+
+    def intern(value: str) -> int:
+        index = strings.get(value)
+        if index is None:
+            index = strings[value] = len(strings)
+        return index
+
+    records: List[bytes] = []
+    for box in box_scores:
+        runs = array("h", box.inning_lines or ())
+        records.append(
+            _RECORD.pack(
+                intern(box.game_id),
+                intern(box.home_team),
+                intern(box.away_team),
+                box.home_score,
+                box.away_score,
+                len(runs) // 2,
+            )
+        )
+        records.append(_little_endian(runs))
+
+    destination = Path(path)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    with open(destination, "wb", buffering=WRITE_BUFFER_SIZE) as handle:
+        handle.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(strings), len(records) // 2))
+        for value in strings:
+            encoded = value.encode("utf-8")
+            handle.write(_STRING_LENGTH.pack(len(encoded)))
+            handle.write(encoded)
+        handle.writelines(records)
+    return destination
+
+
+def read_box_scores(path: Path | str) -> List[BoxScoreSummary]:
+    """Decode a file written by :func:`write_box_scores`."""
+
+    data = Path(path).read_bytes()
+    magic, version, string_count, record_count = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"{path} is not a version {FORMAT_VERSION} box score file")
+    offset = _HEADER.size
+
+    strings: List[str] = []
+    for _ in range(string_count):
+        (length,) = _STRING_LENGTH.unpack_from(data, offset)
+        offset += _STRING_LENGTH.size
+        strings.append(data[offset : offset + length].decode("utf-8"))
+        offset += length
+
+    box_scores: List[BoxScoreSummary] = []
+    for _ in range(record_count):
+        game_id, home_team, away_team, home_score, away_score, innings = _RECORD.unpack_from(data, offset)
+        offset += _RECORD.size
+        runs = array("h")
+        runs.frombytes(data[offset : offset + innings * 2 * runs.itemsize])
+        offset += innings * 2 * runs.itemsize
+        if sys.byteorder != "little":
+            runs.byteswap()
+        box_scores.append(
+            BoxScoreSummary(
+                game_id=strings[game_id],
+                home_team=strings[home_team],
+                away_team=strings[away_team],
+                home_score=home_score,
+                away_score=away_score,
+                inning_lines=array("i", runs),
+            )
+        )
+    return box_scores
+
+
+__all__ = ["FORMAT_VERSION", "read_box_scores", "write_box_scores"]
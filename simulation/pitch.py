@@ -7,49 +7,90 @@ provided by a local ``random.Random`` instance scoped to the call.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Optional
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Protocol, Tuple
 import random
 
 
-def _clamp(value: float, low: float, high: float) -> float:
-    return max(low, min(high, value))
+class _RandomSource(Protocol):
+    """Anything that yields uniform floats in ``[0, 1)`` from ``random()``.
+
+    ``random.Random`` and ``numpy.random.Generator`` both qualify.
+    """
+
+    def random(self) -> float: ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PitcherRatings:
     control: float
     velocity: float
     deception: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BatterRatings:
     contact: float
     power: float
     discipline: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DefenseRatings:
     range: float
     surety: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PitchParticipants:
     pitcher: PitcherRatings
     batter: BatterRatings
     defense: DefenseRatings
+    # Rating-derived terms for this matchup, computed once at construction so a
+    # participants object reused across pitches never re-reads the ratings.
+    terms: _MatchupTerms = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "terms", _matchup_terms(self))
 
-@dataclass(frozen=True)
+
+def _fold_modifiers(modifiers: Dict[str, float]) -> Tuple[float, float, float, float, float]:
+    """Fold the shared ``global`` term into each role modifier, in kernel order."""
+
+    shared = modifiers.get("global", 0.0)
+    return (
+        modifiers.get("pitcher", 0.0) + shared,
+        modifiers.get("batter", 0.0) + shared,
+        modifiers.get("aggression", 0.0) + shared,
+        modifiers.get("contact", 0.0) + shared,
+        modifiers.get("power", 0.0) + shared,
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class PitchContext:
     balls: int
     strikes: int
     outs: int
     bases: tuple[bool, bool, bool]
     situational_modifiers: Dict[str, float]
+    # Role modifiers with the shared "global" term already folded in; filled
+    # once at construction so the resolver reads plain floats per pitch.
+    mod_pitcher: float = field(init=False, repr=False, compare=False)
+    mod_batter: float = field(init=False, repr=False, compare=False)
+    mod_aggression: float = field(init=False, repr=False, compare=False)
+    mod_contact: float = field(init=False, repr=False, compare=False)
+    mod_power: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        pitcher, batter, aggression, contact, power = _fold_modifiers(self.situational_modifiers)
+        object.__setattr__(self, "mod_pitcher", pitcher)
+        object.__setattr__(self, "mod_batter", batter)
+        object.__setattr__(self, "mod_aggression", aggression)
+        object.__setattr__(self, "mod_contact", contact)
+        object.__setattr__(self, "mod_power", power)
 
     def combined_modifier(self, role: str) -> float:
         base = self.situational_modifiers.get(role, 0.0)
@@ -57,31 +98,26 @@ class PitchContext:
         return base + shared
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PitchOutcome:
     result: str
     description: str
     in_zone: bool
     did_swing: bool
     contact_quality: float
+    code: OutcomeCode
 
 
-def resolve_pitch_outcome(
-    participants: PitchParticipants,
-    context: PitchContext,
-    seed: Optional[int] = None,
-    rng: Optional[random.Random] = None,
-) -> PitchOutcome:
-    """Resolve a single pitch using player ratings and situational modifiers.
+class _MatchupTerms(NamedTuple):
+    """Rating-derived terms that stay fixed for a pitcher/batter/defense matchup."""
 
-    The function is pure: given the same inputs and an explicit ``seed`` it will
-    always produce the same ``PitchOutcome``. If an ``rng`` instance is passed in
-    it will be used directly and the ``seed`` will be ignored, enabling callers
-    to drive deterministic sequences across multiple pitches.
-    """
+    advantage_delta: float
+    discipline_edge: float
+    contact_edge: float
+    defensive_cushion: float
 
-    local_rng = rng or random.Random(seed)
 
+def _matchup_terms(participants: PitchParticipants) -> _MatchupTerms:
     pitcher_advantage = (
         participants.pitcher.control * 0.35
         + participants.pitcher.velocity * 0.35
@@ -92,40 +128,6 @@ def resolve_pitch_outcome(
         + participants.batter.discipline * 0.35
         + participants.batter.power * 0.25
     )
-    advantage_delta = pitcher_advantage - batter_pressure
-
-    zone_modifier = context.combined_modifier("pitcher") - context.combined_modifier(
-        "batter"
-    )
-    zone_probability = _clamp(
-        0.55 + 0.003 * advantage_delta + 0.01 * (context.strikes - context.balls)
-        + zone_modifier,
-        0.25,
-        0.9,
-    )
-    in_zone = local_rng.random() < zone_probability
-
-    swing_bias = _clamp(
-        0.5
-        - 0.002 * (participants.batter.discipline - participants.pitcher.deception)
-        + 0.05 * context.strikes
-        + context.combined_modifier("aggression"),
-        0.15,
-        0.95,
-    )
-    swing_probability = swing_bias if not in_zone else _clamp(swing_bias + 0.08, 0.15, 0.99)
-    did_swing = local_rng.random() < swing_probability
-
-    if not did_swing:
-        return PitchOutcome(
-            result="called_strike" if in_zone else "ball",
-            description="Called strike" if in_zone else "Ball out of zone",
-            in_zone=in_zone,
-            did_swing=did_swing,
-            contact_quality=0.0,
-        )
-
-    # Swing decision made; determine contact quality.
     contact_base = (
         participants.batter.contact * 0.55
         + participants.batter.power * 0.25
@@ -136,61 +138,260 @@ def resolve_pitch_outcome(
         + participants.pitcher.deception * 0.4
         + participants.pitcher.control * 0.2
     )
-    contact_quality = contact_base - pitch_difficulty
-    contact_quality += context.combined_modifier("contact") * 100
-    contact_quality += local_rng.uniform(-8.0, 8.0)
-
-    if contact_quality < -5:
-        return PitchOutcome(
-            result="swinging_strike",
-            description="Swing and a miss",
-            in_zone=in_zone,
-            did_swing=did_swing,
-            contact_quality=contact_quality,
-        )
-
-    foul_wall = _clamp(0.25 + 0.002 * (2 - context.strikes), 0.1, 0.45)
-    if local_rng.random() < foul_wall:
-        return PitchOutcome(
-            result="foul",
-            description="Fouled away",
-            in_zone=in_zone,
-            did_swing=did_swing,
-            contact_quality=contact_quality,
-        )
-
     defensive_cushion = (
         participants.defense.range * 0.4 + participants.defense.surety * 0.6
     )
-    in_play_score = contact_quality + context.combined_modifier("power") * 120
-    in_play_score -= defensive_cushion * 0.2
+    return _MatchupTerms(
+        advantage_delta=pitcher_advantage - batter_pressure,
+        discipline_edge=participants.batter.discipline - participants.pitcher.deception,
+        contact_edge=contact_base - pitch_difficulty,
+        defensive_cushion=defensive_cushion,
+    )
+
+
+def _local_rng(seed: Optional[int], rng: Optional[_RandomSource]) -> _RandomSource:
+    if rng is not None:
+        return rng
+    if seed is None:
+        raise ValueError("pass an rng to reuse across pitches, or a seed to build one")
+    return random.Random(seed)
 
-    thresholds = (
-        5,  # out
-        30,  # single
-        55,  # double
-        75,  # triple
+
+def resolve_pitch_outcome(
+    participants: PitchParticipants,
+    context: PitchContext,
+    seed: Optional[int] = None,
+    rng: Optional[_RandomSource] = None,
+) -> PitchOutcome:
+    """Resolve a single pitch using player ratings and situational modifiers.
+
+    The function is pure: given the same inputs and an explicit ``seed`` it will
+    always produce the same ``PitchOutcome``. If an ``rng`` instance is passed in
+    it will be used directly and the ``seed`` will be ignored, enabling callers
+    to drive deterministic sequences across multiple pitches. Only its
+    ``random()`` method is called, so any uniform source can stand in.
+
+    One of ``rng`` or ``seed`` is required. A ``seed`` builds a fresh
+    Mersenne Twister per call, so callers in tight loops should create one
+    generator up front and pass it as ``rng``.
+    """
+
+    return _resolve_with_terms(participants.terms, context, _local_rng(seed, rng))
+
+
+def resolve_pitch_outcomes(
+    participants: PitchParticipants,
+    contexts: Iterable[PitchContext],
+    seed: Optional[int] = None,
+    rng: Optional[_RandomSource] = None,
+) -> List[PitchOutcome]:
+    """Resolve a batch of pitches for one matchup, deriving the rating terms once.
+
+    Draws are taken from a single generator in order, so the result matches
+    calling :func:`resolve_pitch_outcome` for each context with the same ``rng``.
+    """
+
+    local_rng = _local_rng(seed, rng)
+    terms = participants.terms
+    return [_resolve_with_terms(terms, context, local_rng) for context in contexts]
+
+
+class OutcomeCode(IntEnum):
+    """Integer form of :attr:`PitchOutcome.result`, ordered so hits are contiguous.
+
+    For ``SINGLE`` through ``HOMERUN``, ``code - INPLAY_OUT`` is the number of
+    bases the batter takes.
+    """
+
+    BALL = 0
+    CALLED_STRIKE = 1
+    SWINGING_STRIKE = 2
+    FOUL = 3
+    INPLAY_OUT = 4
+    SINGLE = 5
+    DOUBLE = 6
+    TRIPLE = 7
+    HOMERUN = 8
+
+
+# Plain-int copies of the codes for ``_resolve_kernel``, which returns them as
+# indexes into ``_RESULTS``.
+_BALL, _CALLED_STRIKE, _SWINGING_STRIKE, _FOUL = 0, 1, 2, 3
+_INPLAY_OUT, _SINGLE, _DOUBLE, _TRIPLE, _HOMERUN = 4, 5, 6, 7, 8
+
+# Upper bounds for out, single, double and triple; anything higher is a homerun.
+_IN_PLAY_THRESHOLDS = (5, 30, 55, 75)
+
+_RESULTS = (
+    ("ball", "Ball out of zone"),
+    ("called_strike", "Called strike"),
+    ("swinging_strike", "Swing and a miss"),
+    ("foul", "Fouled away"),
+    ("inplay_out", "Weak contact; fielded for an out"),
+    ("single", "Grounder finds a hole"),
+    ("double", "Line drive into the gap"),
+    ("triple", "Driven to the corner"),
+    ("homerun", "Crushed beyond the fence"),
+)
+
+_OUTCOME_CODES = tuple(OutcomeCode)
+
+
+# Taken pitches carry no contact data, so every ball and called strike is the
+# same immutable outcome; share one instance of each instead of reallocating.
+_TAKEN_PITCHES = (
+    PitchOutcome(
+        *_RESULTS[_BALL],
+        in_zone=False,
+        did_swing=False,
+        contact_quality=0.0,
+        code=OutcomeCode.BALL,
+    ),
+    PitchOutcome(
+        *_RESULTS[_CALLED_STRIKE],
+        in_zone=True,
+        did_swing=False,
+        contact_quality=0.0,
+        code=OutcomeCode.CALLED_STRIKE,
+    ),
+)
+
+
+def _resolve_with_terms(
+    terms: _MatchupTerms, context: PitchContext, local_rng: _RandomSource
+) -> PitchOutcome:
+    code, contact_quality, in_zone, did_swing = _resolve_kernel(
+        terms.advantage_delta,
+        terms.discipline_edge,
+        terms.contact_edge,
+        terms.defensive_cushion,
+        context.balls,
+        context.strikes,
+        context.mod_pitcher,
+        context.mod_batter,
+        context.mod_aggression,
+        context.mod_contact,
+        context.mod_power,
+        local_rng.random,
     )
-    if in_play_score < thresholds[0]:
-        result = "inplay_out"
-        description = "Weak contact; fielded for an out"
-    elif in_play_score < thresholds[1]:
-        result = "single"
-        description = "Grounder finds a hole"
-    elif in_play_score < thresholds[2]:
-        result = "double"
-        description = "Line drive into the gap"
-    elif in_play_score < thresholds[3]:
-        result = "triple"
-        description = "Driven to the corner"
-    else:
-        result = "homerun"
-        description = "Crushed beyond the fence"
+    return _build_outcome(code, contact_quality, in_zone, did_swing)
+
+
+def _resolve_folded(
+    terms: _MatchupTerms,
+    balls: int,
+    strikes: int,
+    folded_modifiers: Tuple[float, float, float, float, float],
+    local_rng: _RandomSource,
+) -> PitchOutcome:
+    """Resolve a pitch from a count and :func:`_fold_modifiers` output, no ``PitchContext``.
 
+    Callers that hold the folded modifiers across pitches skip building a
+    context per pitch; the draws match :func:`resolve_pitch_outcome`.
+    """
+
+    mod_pitcher, mod_batter, mod_aggression, mod_contact, mod_power = folded_modifiers
+    code, contact_quality, in_zone, did_swing = _resolve_kernel(
+        terms.advantage_delta,
+        terms.discipline_edge,
+        terms.contact_edge,
+        terms.defensive_cushion,
+        balls,
+        strikes,
+        mod_pitcher,
+        mod_batter,
+        mod_aggression,
+        mod_contact,
+        mod_power,
+        local_rng.random,
+    )
+    return _build_outcome(code, contact_quality, in_zone, did_swing)
+
+
+def _build_outcome(code: int, contact_quality: float, in_zone: bool, did_swing: bool) -> PitchOutcome:
+    if code <= _CALLED_STRIKE:
+        return _TAKEN_PITCHES[code]
+    result, description = _RESULTS[code]
     return PitchOutcome(
         result=result,
         description=description,
         in_zone=in_zone,
         did_swing=did_swing,
-        contact_quality=in_play_score,
+        contact_quality=contact_quality,
+        code=_OUTCOME_CODES[code],
     )
+
+
+def _resolve_kernel(
+    advantage_delta: float,
+    discipline_edge: float,
+    contact_edge: float,
+    defensive_cushion: float,
+    balls: int,
+    strikes: int,
+    mod_pitcher: float,
+    mod_batter: float,
+    mod_aggression: float,
+    mod_contact: float,
+    mod_power: float,
+    draw: Callable[[], float],
+) -> Tuple[int, float, bool, bool]:
+    """Resolve one pitch from plain numbers, returning ``(code, quality, in_zone, swing)``.
+
+    Uniforms are drawn lazily through ``draw`` so that early returns consume
+    exactly as many values as they always have.
+    """
+
+    # Clamps are spelled out inline; this kernel runs for every pitch and a
+    # helper call per bound costs more than the comparisons themselves.
+    zone_probability = (
+        0.55 + 0.003 * advantage_delta + 0.01 * (strikes - balls)
+        + (mod_pitcher - mod_batter)
+    )
+    if zone_probability < 0.25:
+        zone_probability = 0.25
+    elif zone_probability > 0.9:
+        zone_probability = 0.9
+    in_zone = draw() < zone_probability
+
+    swing_bias = 0.5 - 0.002 * discipline_edge + 0.05 * strikes + mod_aggression
+    if swing_bias < 0.15:
+        swing_bias = 0.15
+    elif swing_bias > 0.95:
+        swing_bias = 0.95
+    if in_zone:
+        # swing_bias is already at least 0.15, so only the ceiling can bind.
+        swing_probability = swing_bias + 0.08
+        if swing_probability > 0.99:
+            swing_probability = 0.99
+    else:
+        swing_probability = swing_bias
+    did_swing = draw() < swing_probability
+
+    if not did_swing:
+        return (_CALLED_STRIKE if in_zone else _BALL), 0.0, in_zone, did_swing
+
+    # Swing decision made; determine contact quality.
+    contact_quality = contact_edge
+    contact_quality += mod_contact * 100
+    # Same arithmetic as random.Random.uniform(-8.0, 8.0) on one draw.
+    contact_quality += -8.0 + 16.0 * draw()
+
+    if contact_quality < -5:
+        return _SWINGING_STRIKE, contact_quality, in_zone, did_swing
+
+    foul_wall = 0.25 + 0.002 * (2 - strikes)
+    if foul_wall < 0.1:
+        foul_wall = 0.1
+    elif foul_wall > 0.45:
+        foul_wall = 0.45
+    if draw() < foul_wall:
+        return _FOUL, contact_quality, in_zone, did_swing
+
+    in_play_score = contact_quality + mod_power * 120
+    in_play_score -= defensive_cushion * 0.2
+
+    # bisect_right keeps each threshold itself in the better bucket, matching
+    # the original ``score < threshold`` ladder.
+    code = _INPLAY_OUT + bisect_right(_IN_PLAY_THRESHOLDS, in_play_score)
+    return code, in_play_score, in_zone, did_swing
@@ -7,30 +7,29 @@ portable primitives to make them suitable for JSON serialization.
 
 from __future__ import annotations
 
-from typing import Dict
+from functools import lru_cache
+from typing import Any, Dict
+
+try:  # pragma: no cover - optional validation dependency
+    from jsonschema import validators as _jsonschema_validators
+except ImportError:  # pragma: no cover - schemas remain usable as plain data
+    _jsonschema_validators = None
 
 SCHEMA_VERSION = "1.0.0"
 
 
-def _base_schema(title: str) -> Dict[str, object]:
-    return {
-        "$schema": "http://json-schema.org/draft-07/schema#",
-        "title": title,
-        "type": "object",
-        "properties": {
-            "version": {"type": "string", "const": SCHEMA_VERSION},
-        },
-        "required": ["version"],
-        "additionalProperties": False,
-    }
+_DRAFT_07 = "http://json-schema.org/draft-07/schema#"
 
 
 def player_schema() -> Dict[str, object]:
     """Schema for an individual player entry."""
 
-    schema = _base_schema("Player")
-    schema["properties"].update(
-        {
+    return {
+        "$schema": _DRAFT_07,
+        "title": "Player",
+        "type": "object",
+        "properties": {
+            "version": {"type": "string", "const": SCHEMA_VERSION},
             "id": {"type": "string", "description": "Unique player id"},
             "name": {"type": "string"},
             "handedness": {"type": "string", "enum": ["R", "L", "S"]},
@@ -62,18 +61,21 @@ def player_schema() -> Dict[str, object]:
                 },
                 "additionalProperties": False,
             },
-        }
-    )
-    schema["required"].extend(["id", "name", "handedness", "positions", "ratings"])
-    return schema
+        },
+        "required": ["version", "id", "name", "handedness", "positions", "ratings"],
+        "additionalProperties": False,
+    }
 
 
 def stadium_schema() -> Dict[str, object]:
     """Schema for stadium descriptors and upgrade chains."""
 
-    schema = _base_schema("Stadium")
-    schema["properties"].update(
-        {
+    return {
+        "$schema": _DRAFT_07,
+        "title": "Stadium",
+        "type": "object",
+        "properties": {
+            "version": {"type": "string", "const": SCHEMA_VERSION},
             "id": {"type": "string"},
             "name": {"type": "string"},
             "capacity": {"type": "integer", "minimum": 0},
@@ -102,18 +104,21 @@ def stadium_schema() -> Dict[str, object]:
                 },
                 "default": [],
             },
-        }
-    )
-    schema["required"].extend(["id", "name", "capacity"])
-    return schema
+        },
+        "required": ["version", "id", "name", "capacity"],
+        "additionalProperties": False,
+    }
 
 
 def team_schema() -> Dict[str, object]:
     """Schema describing teams, their roster hooks, and economy levers."""
 
-    schema = _base_schema("Team")
-    schema["properties"].update(
-        {
+    return {
+        "$schema": _DRAFT_07,
+        "title": "Team",
+        "type": "object",
+        "properties": {
+            "version": {"type": "string", "const": SCHEMA_VERSION},
             "id": {"type": "string"},
             "name": {"type": "string"},
             "market_size": {"type": "string", "enum": ["small", "medium", "large"]},
@@ -147,18 +152,21 @@ def team_schema() -> Dict[str, object]:
                 "required": ["cash_on_hand", "ticket_price"],
                 "additionalProperties": False,
             },
-        }
-    )
-    schema["required"].extend(["id", "name", "stadium_id", "lineup", "rotation", "finance"])
-    return schema
+        },
+        "required": ["version", "id", "name", "stadium_id", "lineup", "rotation", "finance"],
+        "additionalProperties": False,
+    }
 
 
 def schedule_schema() -> Dict[str, object]:
     """Schema for the season schedule and pairing details."""
 
-    schema = _base_schema("Schedule")
-    schema["properties"].update(
-        {
+    return {
+        "$schema": _DRAFT_07,
+        "title": "Schedule",
+        "type": "object",
+        "properties": {
+            "version": {"type": "string", "const": SCHEMA_VERSION},
             "season_year": {"type": "integer"},
             "games": {
                 "type": "array",
@@ -175,12 +183,21 @@ def schedule_schema() -> Dict[str, object]:
                     "additionalProperties": False,
                 },
             },
-        }
-    )
-    schema["required"].append("season_year")
-    return schema
+        },
+        "required": ["version", "season_year"],
+        "additionalProperties": False,
+    }
 
 
+# Each builder returns a fresh literal, so callers may mutate what they get.
+# ``get_validator`` compiles from this private set, which nothing hands out.
+_SCHEMAS_BY_NAME: Dict[str, Dict[str, object]] = {
+    "player": player_schema(),
+    "team": team_schema(),
+    "stadium": stadium_schema(),
+    "schedule": schedule_schema(),
+}
+
 SCHEMAS: Dict[str, Dict[str, object]] = {
     "player": player_schema(),
     "team": team_schema(),
@@ -188,4 +205,31 @@ SCHEMAS: Dict[str, Dict[str, object]] = {
     "schedule": schedule_schema(),
 }
 
-__all__ = ["SCHEMA_VERSION", "SCHEMAS", "player_schema", "team_schema", "stadium_schema", "schedule_schema"]
+
+@lru_cache(maxsize=None)
+def get_validator(name: str) -> Any:
+    """Return a ``jsonschema`` validator for the named schema, compiled once per process.
+
+    Checking the schema and building the validator class dominates a one-off
+    ``jsonschema.validate`` call, so repeated validations should go through the
+    cached instance: ``get_validator("team").validate(document)``.
+    """
+
+    if _jsonschema_validators is None:
+        raise ImportError("get_validator requires the optional 'jsonschema' package")
+
+    schema = _SCHEMAS_BY_NAME[name]
+    validator_cls = _jsonschema_validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
+__all__ = [
+    "SCHEMA_VERSION",
+    "SCHEMAS",
+    "get_validator",
+    "player_schema",
+    "team_schema",
+    "stadium_schema",
+    "schedule_schema",
+]
@@ -2,18 +2,31 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
+from array import array
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Sequence
+from collections.abc import Sequence as SequenceABC
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
 import random
 
+from ._frozen import FrozenDict
+from ._json import dumps
 from .crowd import CrowdEnergyAccumulator, CrowdEnergySnapshot
-from .pitch import PitchContext, PitchOutcome, PitchParticipants, BatterRatings, PitcherRatings, DefenseRatings, resolve_pitch_outcome
+from .pitch import (
+    OutcomeCode,
+    PitchOutcome,
+    PitchParticipants,
+    BatterRatings,
+    PitcherRatings,
+    DefenseRatings,
+    _RandomSource,
+    _fold_modifiers,
+    _resolve_folded,
+)
 from .persistence import BoxScoreSummary, SeasonState, save_season_state
 
 
-@dataclass
+@dataclass(slots=True)
 class PitchEvent:
     number: int
     batter: str
@@ -75,14 +88,385 @@ class PitchEvent:
 
         return payload
 
+    def to_json(self) -> bytes:
+        """Encode :meth:`as_payload` as compact UTF-8 JSON bytes."""
+
+        return dumps(self.as_payload())
+
     def as_dict(self) -> Dict[str, object]:
         # Maintain backwards compatibility for JSON dumping callers while
         # enforcing the standardized payload format.
         return self.as_payload()
 
 
+# Base occupancy packed as first | second << 1 | third << 2 for compact columns.
+_BASES_BY_MASK: tuple[tuple[bool, bool, bool], ...] = tuple(
+    (bool(mask & 1), bool(mask & 2), bool(mask & 4)) for mask in range(8)
+)
+
+
+def _bases_mask(bases: tuple[bool, bool, bool]) -> int:
+    return bases[0] | bases[1] << 1 | bases[2] << 2
+
+
+class ReplayColumns(SequenceABC):
+    """Column-oriented pitch log that reads back as ``PitchEvent.as_payload`` dicts.
+
+    Numeric fields sit in typed ``array`` columns and strings and modifier
+    mappings in plain lists, so a long game costs a few bytes per pitch rather
+    than a tree of nested dicts. Indexing or iterating builds the payload dicts
+    on demand. Logs created with ``half_innings=True`` also record which
+    half-inning each pitch belongs to and add the ``half_inning`` header.
+    """
+
+    def __init__(self, *, half_innings: bool = False) -> None:
+        self.half_innings = half_innings
+        self.number = array("i")
+        self.batter: List[str] = []
+        self.outcome: List[str] = []
+        self.detail: List[str] = []
+        self.balls_before = array("b")
+        self.strikes_before = array("b")
+        self.outs_before = array("b")
+        self.balls_after = array("b")
+        self.strikes_after = array("b")
+        self.outs_after = array("b")
+        self.bases_before = array("B")
+        self.bases_after = array("B")
+        self.runs_scored = array("i")
+        self.total_runs = array("i")
+        self.contact_quality = array("d")
+        self.crowd_energy_before = array("d")
+        self.crowd_energy_after = array("d")
+        self.crowd_modifiers: List[Dict[str, float]] = []
+        self.context_modifiers: List[Dict[str, float]] = []
+        self.modifier_flags: List[Dict[str, bool]] = []
+        # Half-inning columns; only filled when ``half_innings`` is set.
+        self.inning = array("H")
+        self.half = array("b")  # 0 for the top half, 1 for the bottom
+        self.batting_team: List[str] = []
+
+    def append(self, event: PitchEvent) -> None:
+        self.number.append(event.number)
+        self.batter.append(event.batter)
+        self.outcome.append(event.outcome)
+        self.detail.append(event.detail)
+        self.balls_before.append(event.balls_before)
+        self.strikes_before.append(event.strikes_before)
+        self.outs_before.append(event.outs_before)
+        self.balls_after.append(event.balls_after)
+        self.strikes_after.append(event.strikes_after)
+        self.outs_after.append(event.outs_after)
+        self.bases_before.append(_bases_mask(event.bases_before))
+        self.bases_after.append(_bases_mask(event.bases_after))
+        self.runs_scored.append(event.runs_scored)
+        self.total_runs.append(event.total_runs)
+        self.contact_quality.append(event.contact_quality)
+        self.crowd_energy_before.append(event.crowd_energy_before)
+        self.crowd_energy_after.append(event.crowd_energy_after)
+        self.crowd_modifiers.append(event.crowd_modifiers)
+        self.context_modifiers.append(event.context_modifiers)
+        self.modifier_flags.append(event.modifier_flags)
+
+    def extend_half(self, other: "ReplayColumns", *, inning: int, half: str, batting_team: str) -> None:
+        """Append every pitch from ``other``, tagging each with its half-inning."""
+
+        for name in _REPLAY_EVENT_COLUMNS:
+            getattr(self, name).extend(getattr(other, name))
+        count = len(other)
+        self.inning.extend([inning] * count)
+        self.half.extend([0 if half == "top" else 1] * count)
+        self.batting_team.extend([batting_team] * count)
+
+    def event(self, index: int) -> PitchEvent:
+        """Rebuild the ``PitchEvent`` recorded at ``index``."""
+
+        return PitchEvent(
+            number=self.number[index],
+            batter=self.batter[index],
+            outcome=self.outcome[index],
+            detail=self.detail[index],
+            balls_before=self.balls_before[index],
+            strikes_before=self.strikes_before[index],
+            outs_before=self.outs_before[index],
+            balls_after=self.balls_after[index],
+            strikes_after=self.strikes_after[index],
+            outs_after=self.outs_after[index],
+            bases_before=_BASES_BY_MASK[self.bases_before[index]],
+            bases_after=_BASES_BY_MASK[self.bases_after[index]],
+            runs_scored=self.runs_scored[index],
+            total_runs=self.total_runs[index],
+            contact_quality=self.contact_quality[index],
+            crowd_energy_before=self.crowd_energy_before[index],
+            crowd_energy_after=self.crowd_energy_after[index],
+            crowd_modifiers=self.crowd_modifiers[index],
+            context_modifiers=self.context_modifiers[index],
+            modifier_flags=self.modifier_flags[index],
+        )
+
+    def _payload(self, index: int) -> Dict[str, object]:
+        payload = self.event(index).as_payload()
+        if self.half_innings:
+            payload["half_inning"] = {
+                "inning": self.inning[index],
+                "half": "bottom" if self.half[index] else "top",
+                "batting_team": self.batting_team[index],
+            }
+        return payload
+
+    def __len__(self) -> int:
+        return len(self.number)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._payload(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("replay index out of range")
+        return self._payload(index)
+
+    def __iter__(self) -> Iterator[Dict[str, object]]:
+        for index in range(len(self)):
+            yield self._payload(index)
+
+
+class _PitchEventView(SequenceABC):
+    """Read-only ``PitchEvent`` sequence over a :class:`ReplayColumns` log.
+
+    Events are rebuilt from the columns on access rather than kept alive, so
+    indexing twice returns equal but distinct objects.
+    """
+
+    __slots__ = ("_columns",)
+
+    def __init__(self, columns: ReplayColumns) -> None:
+        self._columns = columns
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def __getitem__(self, index):
+        columns = self._columns
+        if isinstance(index, slice):
+            return [columns.event(i) for i in range(*index.indices(len(columns)))]
+        if index < 0:
+            index += len(columns)
+        if not 0 <= index < len(columns):
+            raise IndexError("event index out of range")
+        return columns.event(index)
+
+    def __iter__(self) -> Iterator[PitchEvent]:
+        columns = self._columns
+        for index in range(len(columns)):
+            yield columns.event(index)
+
+
+# Per-pitch columns of ``ReplayColumns``, in ``PitchEvent`` field order; the
+# half-inning tag columns are filled separately by ``extend_half``.
+_REPLAY_EVENT_COLUMNS = (
+    "number",
+    "batter",
+    "outcome",
+    "detail",
+    "balls_before",
+    "strikes_before",
+    "outs_before",
+    "balls_after",
+    "strikes_after",
+    "outs_after",
+    "bases_before",
+    "bases_after",
+    "runs_scored",
+    "total_runs",
+    "contact_quality",
+    "crowd_energy_before",
+    "crowd_energy_after",
+    "crowd_modifiers",
+    "context_modifiers",
+    "modifier_flags",
+)
+
+
+Bases = tuple[bool, bool, bool]
+
+# ``bases_taken`` value that stands for a walk in ``_BASE_TRANSITIONS``.
+_WALK = 0
+
+
+def _walk_transition(bases: Bases) -> tuple[Bases, int]:
+    runs = 0
+    new_bases = [False, False, False]
+    first, second, third = bases
+
+    if third and second and first:
+        runs += 1
+    elif third:
+        new_bases[2] = True
+
+    if second and first:
+        new_bases[2] = True
+    elif second:
+        new_bases[1] = True
+
+    if first:
+        new_bases[1] = True
+
+    new_bases[0] = True
+    return tuple(new_bases), runs
+
+
+def _advance_transition(bases: Bases, bases_taken: int) -> tuple[Bases, int]:
+    runs = 0
+    new_bases = [False, False, False]
+    for idx in range(2, -1, -1):
+        if bases[idx]:
+            destination = idx + bases_taken
+            if destination >= 3:
+                runs += 1
+            else:
+                new_bases[destination] = True
+    if bases_taken < 4:
+        destination = bases_taken - 1
+        if destination >= 0:
+            new_bases[destination] = True
+    else:
+        runs += 1
+    return tuple(new_bases), runs
+
+
+def _build_base_transitions() -> tuple[tuple[int, int], ...]:
+    table: List[tuple[int, int]] = []
+    for state in _BASES_BY_MASK:
+        for bases_taken in range(5):
+            if bases_taken == _WALK:
+                new_bases, runs = _walk_transition(state)
+            else:
+                new_bases, runs = _advance_transition(state, bases_taken)
+            table.append((_bases_mask(new_bases), runs))
+    return tuple(table)
+
+
+# ``(new_bases_mask, runs)`` for every occupancy mask and ``bases_taken`` (0 for a
+# walk), indexed by ``bases_mask * 5 + bases_taken``. Built once from the
+# reference rules above.
+_BASE_TRANSITIONS = _build_base_transitions()
+
+
+# Shared stand-in for "no crowd modifiers" when crowd effects are off.
+_NO_MODIFIERS: Dict[str, float] = FrozenDict()
+
+# Payload names indexed by ``OutcomeCode``; matches ``PitchOutcome.result``.
+_OUTCOME_NAMES = tuple(code.name.lower() for code in OutcomeCode)
+
+
+def _apply_outcome(
+    code: int, balls: int, strikes: int, outs: int, bases: int
+) -> tuple[str, int, int, int, int, int, bool]:
+    """Apply a resolved pitch's :class:`OutcomeCode` to the count, outs, and packed bases mask.
+
+    Returns ``(applied_result, balls, strikes, outs, bases, runs_scored,
+    batter_done)``. The function touches no objects, only the plain values
+    passed in, so the state machine can be tabulated or compiled separately
+    from the event bookkeeping around it. When ``batter_done`` is set the
+    returned count is already reset for the next batter.
+    """
+
+    if code == OutcomeCode.BALL:
+        balls += 1
+        if balls >= 4:
+            bases, runs = _BASE_TRANSITIONS[bases * 5 + _WALK]
+            return "walk", 0, 0, outs, bases, runs, True
+        return "ball", balls, strikes, outs, bases, 0, False
+
+    if code <= OutcomeCode.SWINGING_STRIKE:
+        strikes += 1
+        if strikes >= 3:
+            return "strikeout", 0, 0, outs + 1, bases, 0, True
+        return _OUTCOME_NAMES[code], balls, strikes, outs, bases, 0, False
+
+    if code == OutcomeCode.FOUL:
+        if strikes < 2:
+            strikes += 1
+        return "foul", balls, strikes, outs, bases, 0, False
+
+    if code == OutcomeCode.INPLAY_OUT:
+        return "inplay_out", 0, 0, outs + 1, bases, 0, True
+
+    # Hits are contiguous after INPLAY_OUT, so the offset is the bases taken.
+    bases, runs = _BASE_TRANSITIONS[bases * 5 + code - OutcomeCode.INPLAY_OUT]
+    return _OUTCOME_NAMES[code], 0, 0, outs, bases, runs, True
+
+
+def _build_outcome_table() -> tuple[tuple[str, int, int, int, int, int, bool], ...]:
+    return tuple(
+        _apply_outcome(code, balls, strikes, outs, bases)
+        for code in OutcomeCode
+        for balls in range(4)
+        for strikes in range(3)
+        for outs in range(3)
+        for bases in range(8)
+    )
+
+
+# Every result of ``_apply_outcome`` for a live half-inning (fewer than three
+# outs), indexed by ``(((code * 4 + balls) * 3 + strikes) * 3 + outs) * 8 +
+# bases``. Replaces the branch chain with one tuple lookup per pitch; the
+# function above stays the reference rules.
+_OUTCOME_TABLE = _build_outcome_table()
+
+
+def _ndjson_writer(stream: BinaryIO) -> Callable[[bytes], None]:
+    write = stream.write
+
+    def write_line(encoded: bytes) -> None:
+        write(encoded)
+        write(b"\n")
+
+    return write_line
+
+
 class HalfInningState:
-    """Track a single half-inning and log every pitch."""
+    """Track a single half-inning and log every pitch.
+
+    ``replay_log`` is a :class:`ReplayColumns`, and ``events`` reads the same
+    columns back as ``PitchEvent`` objects. With ``replay_stream`` set, each
+    payload is instead written to that binary handle as one NDJSON line and
+    nothing is kept in memory. ``loggers`` each receive the
+    pitch's payload dict, built once per pitch and shared, so they must treat
+    it as read-only.
+    """
+
+    __slots__ = (
+        "lineup",
+        "pitcher",
+        "defense",
+        "base_modifiers",
+        "balls",
+        "strikes",
+        "outs",
+        "bases_mask",
+        "runs",
+        "batter_index",
+        "pitch_number",
+        "replay_log",
+        "record_replay",
+        "_rng",
+        "crowd",
+        "_loggers",
+        "_json_loggers",
+        "_participant_cache",
+        "_crowd_on",
+        "_stadium_on",
+        "_organ_on",
+        "_modifier_flags",
+        "_idle_crowd",
+        "_cached_effective",
+        "_cached_folded",
+        "_cached_crowd_modifiers",
+        "_cached_organ_modifier",
+        "_cached_base",
+    )
 
     def __init__(
         self,
@@ -94,9 +478,13 @@ class HalfInningState:
         *,
         starting_batter_index: int = 0,
         loggers: Optional[Sequence[Callable[[Dict[str, object]], None]]] = None,
+        json_loggers: Optional[Sequence[Callable[[bytes], None]]] = None,
         enable_crowd_effects: bool = True,
         enable_stadium_effects: bool = True,
         enable_organ_flair: bool = False,
+        record_replay: bool = True,
+        rng: Optional[_RandomSource] = None,
+        replay_stream: Optional[BinaryIO] = None,
     ) -> None:
         self.lineup = lineup
         self.pitcher = pitcher
@@ -105,63 +493,137 @@ class HalfInningState:
         self.balls = 0
         self.strikes = 0
         self.outs = 0
-        self.bases: tuple[bool, bool, bool] = (False, False, False)
+        # Occupancy packed as first | second << 1 | third << 2; see ``bases``.
+        self.bases_mask = 0
         self.runs = 0
         self.batter_index = starting_batter_index
         self.pitch_number = 0
-        self.events: List[PitchEvent] = []
-        self.replay_log: List[Dict[str, object]] = []
-        self._rng = random.Random(seed)
+        self.replay_log = ReplayColumns()
+        # Score-only callers skip keeping events and replay columns entirely, as
+        # does streaming, where the stream is the replay.
+        self.record_replay = record_replay and replay_stream is None
+        # A caller-owned ``rng`` is drawn from in place and ``seed`` is ignored.
+        # Only its ``random()`` is called, so a ``numpy.random.Generator`` works
+        # too; seeded halves keep ``random.Random`` so golden replays hold.
+        self._rng = rng if rng is not None else random.Random(seed)
         self.crowd = CrowdEnergyAccumulator()
         self._loggers: List[Callable[[Dict[str, object]], None]] = list(loggers or [])
-        self._modifier_flags = {
-            "crowd": enable_crowd_effects,
-            "stadium": enable_stadium_effects,
-            "organ": enable_organ_flair,
-        }
+        # Sinks that want the wire format get one shared encoding per pitch
+        # instead of each copying and re-encoding the payload dict.
+        self._json_loggers: List[Callable[[bytes], None]] = list(json_loggers or [])
+        if replay_stream is not None:
+            self._json_loggers.append(_ndjson_writer(replay_stream))
+        self._participant_cache: Dict[int, PitchParticipants] = {}
+        # Plain attributes rather than a dict so the pitch loop avoids subscripts.
+        self._crowd_on = enable_crowd_effects
+        self._stadium_on = enable_stadium_effects
+        self._organ_on = enable_organ_flair
+        # One read-only flags mapping per half-inning, shared by all its events.
+        self._modifier_flags: Dict[str, bool] = FrozenDict(
+            crowd=enable_crowd_effects,
+            stadium=enable_stadium_effects,
+            organ=enable_organ_flair,
+        )
+        # With crowd effects off nothing ticks or feeds the accumulator, so one
+        # snapshot taken up front stands in for every pitch.
+        self._idle_crowd = None if enable_crowd_effects else self.crowd.snapshot()
+        self._cached_effective: Optional[Dict[str, float]] = None
+        self._cached_folded = _fold_modifiers({})
+        self._cached_crowd_modifiers: Optional[Dict[str, float]] = None
+        self._cached_organ_modifier = 0.0
+        self._cached_base: Optional[Dict[str, float]] = None
+
+    @property
+    def events(self) -> Sequence[PitchEvent]:
+        """Recorded pitches as ``PitchEvent`` objects, rebuilt from ``replay_log``.
+
+        Each access rebuilds the events, so hold on to the result rather than
+        indexing ``events`` repeatedly. Halves built with ``record_replay=False``
+        or a ``replay_stream`` keep no events and raise ``RuntimeError``.
+        """
+
+        if not self.record_replay:
+            raise RuntimeError(
+                "events are not recorded for this half-inning; build it with "
+                "record_replay=True and no replay_stream, or read the stream instead"
+            )
+        return _PitchEventView(self.replay_log)
+
+    @property
+    def bases(self) -> tuple[bool, bool, bool]:
+        """Occupancy of first, second, and third; a shared tuple per state."""
+
+        return _BASES_BY_MASK[self.bases_mask]
+
+    @bases.setter
+    def bases(self, value: Sequence[bool]) -> None:
+        self.bases_mask = _bases_mask(value)
 
     def _current_batter(self) -> Dict[str, object]:
         return self.lineup[self.batter_index % len(self.lineup)]
 
-    def _participants(self) -> PitchParticipants:
-        batter = self._current_batter()
-        batter_ratings: BatterRatings = batter["ratings"]
-        return PitchParticipants(
-            pitcher=self.pitcher,
-            batter=batter_ratings,
-            defense=self.defense,
-        )
-
-    def _context(self, modifiers: Optional[Dict[str, float]] = None) -> PitchContext:
-        return PitchContext(
-            balls=self.balls,
-            strikes=self.strikes,
-            outs=self.outs,
-            bases=self.bases,
-            situational_modifiers=modifiers if modifiers is not None else self._effective_modifiers(),
-        )
+    def _participants(self, slot: int) -> PitchParticipants:
+        participants = self._participant_cache.get(slot)
+        batter_ratings: BatterRatings = self.lineup[slot]["ratings"]
+        # Reuse the slot's bundle unless the batter, pitcher or defense was swapped out.
+        if (
+            participants is None
+            or participants.batter is not batter_ratings
+            or participants.pitcher is not self.pitcher
+            or participants.defense is not self.defense
+        ):
+            participants = PitchParticipants(
+                pitcher=self.pitcher,
+                batter=batter_ratings,
+                defense=self.defense,
+            )
+            self._participant_cache[slot] = participants
+        return participants
 
     def _effective_modifiers(
         self, crowd_snapshot: Optional[CrowdEnergySnapshot] = None
     ) -> Dict[str, float]:
-        effective: Dict[str, float] = {}
-
-        if self._modifier_flags["stadium"]:
-            effective.update(self.base_modifiers)
-
-        if self._modifier_flags["crowd"]:
-            crowd_state = crowd_snapshot or self.crowd.snapshot()
-            for key, value in crowd_state.modifiers.items():
-                effective[key] = effective.get(key, 0.0) + value
-
-        organ_modifier = self._organ_modifier(crowd_snapshot)
-        if organ_modifier and self._modifier_flags["organ"]:
-            effective["organ"] = effective.get("organ", 0.0) + organ_modifier
-
+        # The merge only changes when the crowd's memoized modifiers, the organ
+        # nudge or the stadium modifiers do, so consecutive pitches often share
+        # one read-only mapping (and its folded form), which PitchEvent keeps
+        # as-is. A rebuild that lands on the same values reuses it too. The
+        # stadium part is compared against a snapshot, which catches both
+        # in-place edits to ``base_modifiers`` and the stadium toggle.
+        crowd_modifiers: Optional[Dict[str, float]] = None
+        if self._crowd_on:
+            crowd_modifiers = (crowd_snapshot or self.crowd.snapshot()).modifiers
+        organ_modifier = self._organ_modifier(crowd_snapshot) if self._organ_on else 0.0
+        base = self.base_modifiers if self._stadium_on else None
+
+        effective = self._cached_effective
+        if (
+            effective is not None
+            and crowd_modifiers is self._cached_crowd_modifiers
+            and organ_modifier == self._cached_organ_modifier
+            and base == self._cached_base
+        ):
+            return effective
+
+        merged = dict(base) if base is not None else {}
+
+        if crowd_modifiers is not None:
+            get = merged.get
+            for key, value in crowd_modifiers.items():
+                merged[key] = get(key, 0.0) + value
+
+        if organ_modifier:
+            merged["organ"] = merged.get("organ", 0.0) + organ_modifier
+
+        if effective is None or merged != effective:
+            effective = self._cached_effective = FrozenDict(merged)
+            self._cached_folded = _fold_modifiers(effective)
+        self._cached_crowd_modifiers = crowd_modifiers
+        self._cached_organ_modifier = organ_modifier
+        self._cached_base = dict(base) if base is not None else None
         return effective
 
     def _organ_modifier(self, crowd_snapshot: Optional[CrowdEnergySnapshot]) -> float:
-        if not self._modifier_flags["organ"]:
+        if not self._organ_on:
             return 0.0
 
         reference = crowd_snapshot or self.crowd.snapshot()
@@ -170,117 +632,74 @@ class HalfInningState:
         # when the crowd is already buzzing.
         return min(0.02, 0.01 + 0.03 * momentum)
 
-    def _advance_batter(self) -> None:
-        self.balls = 0
-        self.strikes = 0
-        self.batter_index += 1
-
-    def _record_out(self) -> None:
-        self.outs += 1
-        self._advance_batter()
-
-    def _walk_batter(self) -> int:
-        runs = 0
-        new_bases = [False, False, False]
-        first, second, third = self.bases
-
-        if third and second and first:
-            runs += 1
-        elif third:
-            new_bases[2] = True
-
-        if second and first:
-            new_bases[2] = True
-        elif second:
-            new_bases[1] = True
-
-        if first:
-            new_bases[1] = True
-
-        new_bases[0] = True
-
-        self.bases = tuple(new_bases)
-        self._advance_batter()
-        return runs
-
-    def _advance_runners(self, bases_taken: int) -> int:
-        runs = 0
-        new_bases = [False, False, False]
-        for idx in range(2, -1, -1):
-            if self.bases[idx]:
-                destination = idx + bases_taken
-                if destination >= 3:
-                    runs += 1
-                else:
-                    new_bases[destination] = True
-        if bases_taken < 4:
-            destination = bases_taken - 1
-            if destination >= 0:
-                new_bases[destination] = True
-        else:
-            runs += 1
-        self.bases = tuple(new_bases)
-        self._advance_batter()
-        return runs
-
-    def _log_payload(self, payload: Dict[str, object]) -> None:
-        snapshot = deepcopy(payload)
-        self.replay_log.append(snapshot)
+    def _log_event(self, event: PitchEvent) -> None:
+        if not (self._loggers or self._json_loggers):
+            return
+
+        payload = event.as_payload()
         for logger in self._loggers:
-            logger(deepcopy(snapshot))
+            logger(payload)
+        if self._json_loggers:
+            encoded = dumps(payload)
+            for json_logger in self._json_loggers:
+                json_logger(encoded)
 
     def pitch_once(self, seed: Optional[int] = None) -> PitchEvent:
-        participants = self._participants()
-        decayed_snapshot = self.crowd.tick() if self._modifier_flags["crowd"] else self.crowd.snapshot()
+        return self._pitch(seed, True)
+
+    def _pitch(self, seed: Optional[int], emit: bool) -> Optional[PitchEvent]:
+        # With ``emit`` unset the state advances exactly as in pitch_once, but
+        # no PitchEvent (or its modifier-flags dict) is allocated.
+        # Resolve the lineup slot once; the batter index only moves after the
+        # outcome is applied, so the name and ratings come from the same slot.
+        slot = self.batter_index % len(self.lineup)
+        participants = self._participants(slot)
+        decayed_snapshot = self.crowd.tick() if self._crowd_on else self._idle_crowd
         context_modifiers = self._effective_modifiers(decayed_snapshot)
-        context = self._context(context_modifiers)
-        outcome = resolve_pitch_outcome(
-            participants, context, rng=self._rng if seed is None else None, seed=seed
+        # Same draws as resolve_pitch_outcome, minus the per-pitch PitchContext:
+        # the folded modifiers are cached alongside the merged dict.
+        outcome = _resolve_folded(
+            participants.terms,
+            self.balls,
+            self.strikes,
+            self._cached_folded,
+            self._rng if seed is None else random.Random(seed),
         )
 
         self.pitch_number += 1
-        batter_name = self._current_batter().get("name", "Unknown")
-        pre_bases = self.bases
+        pre_bases = self.bases_mask
         pre_balls = self.balls
         pre_strikes = self.strikes
         pre_outs = self.outs
 
-        applied_result = outcome.result
-        runs_scored = 0
-
-        if outcome.result == "ball":
-            self.balls += 1
-            if self.balls >= 4:
-                runs_scored = self._walk_batter()
-                applied_result = "walk"
-        elif outcome.result in {"called_strike", "swinging_strike"}:
-            self.strikes += 1
-            if self.strikes >= 3:
-                self._record_out()
-                applied_result = "strikeout"
-        elif outcome.result == "foul":
-            if self.strikes < 2:
-                self.strikes += 1
-        elif outcome.result == "inplay_out":
-            self._record_out()
-            applied_result = "inplay_out"
-        elif outcome.result in {"single", "double", "triple", "homerun"}:
-            bases_taken = {"single": 1, "double": 2, "triple": 3, "homerun": 4}[outcome.result]
-            runs_scored = self._advance_runners(bases_taken)
-            applied_result = outcome.result
-        else:
-            applied_result = outcome.result
+        (
+            applied_result,
+            self.balls,
+            self.strikes,
+            self.outs,
+            self.bases_mask,
+            runs_scored,
+            batter_done,
+        ) = (
+            _OUTCOME_TABLE[(((outcome.code * 4 + pre_balls) * 3 + pre_strikes) * 3 + pre_outs) * 8 + pre_bases]
+            if pre_outs < 3
+            else _apply_outcome(outcome.code, pre_balls, pre_strikes, pre_outs, pre_bases)
+        )
+        if batter_done:
+            self.batter_index += 1
 
         self.runs += runs_scored
         updated_crowd = (
             self.crowd.apply_event(applied_result, runs_scored, outcome.contact_quality)
-            if self._modifier_flags["crowd"]
+            if self._crowd_on
             else decayed_snapshot
         )
+        if not emit:
+            return None
 
         event = PitchEvent(
             number=self.pitch_number,
-            batter=batter_name,
+            batter=self.lineup[slot].get("name", "Unknown"),
             outcome=applied_result,
             detail=outcome.description,
             balls_before=pre_balls,
@@ -289,28 +708,98 @@ class HalfInningState:
             balls_after=self.balls,
             strikes_after=self.strikes,
             outs_after=self.outs,
-            bases_before=pre_bases,
-            bases_after=self.bases,
+            bases_before=_BASES_BY_MASK[pre_bases],
+            bases_after=_BASES_BY_MASK[self.bases_mask],
             runs_scored=runs_scored,
             total_runs=self.runs,
             contact_quality=outcome.contact_quality,
             crowd_energy_before=decayed_snapshot.energy,
             crowd_energy_after=updated_crowd.energy,
-            crowd_modifiers=updated_crowd.modifiers if self._modifier_flags["crowd"] else {},
-            context_modifiers=dict(context_modifiers),
-            modifier_flags=dict(self._modifier_flags),
+            crowd_modifiers=updated_crowd.modifiers if self._crowd_on else _NO_MODIFIERS,
+            context_modifiers=context_modifiers,
+            modifier_flags=self._modifier_flags,
         )
-        self.events.append(event)
-        self._log_payload(event.as_payload())
+        if self.record_replay:
+            self.replay_log.append(event)
+        self._log_event(event)
         return event
 
     def is_complete(self) -> bool:
         return self.outs >= 3
 
     def play_to_completion(self, max_pitches: int = 100) -> List[PitchEvent]:
+        """Pitch until three outs or ``max_pitches``; return every recorded event.
+
+        Halves that do not record a replay return an empty list.
+        """
+
+        self._play_out(max_pitches)
+        return list(self.events) if self.record_replay else []
+
+    def _play_out(self, max_pitches: int) -> None:
+        # Nobody can see the events of a score-only half without loggers.
+        emit = bool(self.record_replay or self._loggers or self._json_loggers)
         while not self.is_complete() and self.pitch_number < max_pitches:
-            self.pitch_once()
-        return self.events
+            self._pitch(None, emit)
+
+    def _restart(self) -> None:
+        """Reset to a fresh half-inning from the top of the lineup.
+
+        Per-matchup participants and the modifier caches survive, which is what
+        lets :meth:`simulate_batch` reuse one state across many halves.
+        """
+
+        self.balls = self.strikes = self.outs = 0
+        self.bases_mask = 0
+        self.runs = 0
+        self.batter_index = 0
+        self.pitch_number = 0
+        if self._crowd_on:
+            self.crowd = CrowdEnergyAccumulator()
+
+    @classmethod
+    def simulate_batch(
+        cls,
+        seeds: Iterable[int],
+        *,
+        lineup: Sequence[Dict[str, object]],
+        defense: DefenseRatings,
+        pitcher: PitcherRatings,
+        situational_modifiers: Optional[Dict[str, float]] = None,
+        max_pitches: int = 100,
+        enable_crowd_effects: bool = True,
+        enable_stadium_effects: bool = True,
+        enable_organ_flair: bool = False,
+    ) -> tuple[array, array]:
+        """Play one score-only half-inning per seed; return ``(runs, pitches)`` columns.
+
+        Entry ``i`` matches ``HalfInningState(..., seed=seeds[i])`` played to
+        completion on its own. The batch reuses a single state and generator,
+        reseeding between halves, so the per-slot matchup terms and folded
+        modifiers are derived once for the whole batch instead of once per half.
+        """
+
+        rng = random.Random()
+        half = cls(
+            lineup,
+            defense,
+            pitcher,
+            situational_modifiers,
+            enable_crowd_effects=enable_crowd_effects,
+            enable_stadium_effects=enable_stadium_effects,
+            enable_organ_flair=enable_organ_flair,
+            record_replay=False,
+            rng=rng,
+        )
+        runs = array("i")
+        pitches = array("i")
+        for seed in seeds:
+            rng.seed(seed)
+            half._restart()
+            half._play_out(max_pitches)
+            runs.append(half.runs)
+            pitches.append(half.pitch_number)
+        return runs, pitches
 
 
 class GameState:
@@ -336,12 +825,16 @@ class GameState:
         enable_crowd_effects: bool = True,
         enable_stadium_effects: bool = True,
         enable_organ_flair: bool = False,
+        record_replay: bool = True,
+        share_rng: bool = False,
     ) -> None:
         self.game_id = game_id
         self.home_team = home_team
         self.away_team = away_team
-        self.home_lineup = list(home_lineup)
-        self.away_lineup = list(away_lineup)
+        # Lineups are read-only during play; tuple() is free for callers that
+        # already pass tuples, such as precomputed season rotations.
+        self.home_lineup = tuple(home_lineup)
+        self.away_lineup = tuple(away_lineup)
         self.home_pitcher = home_pitcher
         self.away_pitcher = away_pitcher
         self.home_defense = home_defense
@@ -353,10 +846,21 @@ class GameState:
         self.enable_crowd_effects = enable_crowd_effects
         self.enable_stadium_effects = enable_stadium_effects
         self.enable_organ_flair = enable_organ_flair
+        # With ``record_replay=False`` only scores, inning lines and pitch counts
+        # are kept, which is all Monte Carlo and schedule sweeps need.
+        self.record_replay = record_replay
+        # By default each half-inning gets its own Random seeded from the game
+        # stream, which keeps half-level replays reproducible. ``share_rng``
+        # hands the game's Random to every half instead; still deterministic
+        # for a given ``seed`` but produces different games than the default.
+        self.share_rng = share_rng
         self.home_score = 0
         self.away_score = 0
-        self.inning_lines: List[List[int]] = []
-        self.replay_log: List[Dict[str, object]] = []
+        # Completed innings only; rows are never mutated once appended.
+        self.inning_lines: List[tuple[int, int]] = []
+        self.replay_log = ReplayColumns(half_innings=True)
+        # Pitches thrown while the away side (index 0) and home side (1) batted.
+        self._pitches_by_half = [0, 0]
         self._home_batter_index = 0
         self._away_batter_index = 0
         self._rng = random.Random(seed)
@@ -364,15 +868,15 @@ class GameState:
     def _half_seed(self) -> Optional[int]:
         return self._rng.randint(0, 1_000_000)
 
-    def _annotate_events(
-        self, events: List[Dict[str, object]], inning: int, half: str, batting_team: str
-    ) -> List[Dict[str, object]]:
-        annotated: List[Dict[str, object]] = []
-        for payload in events:
-            snapshot = deepcopy(payload)
-            snapshot["half_inning"] = {"inning": inning, "half": half, "batting_team": batting_team}
-            annotated.append(snapshot)
-        return annotated
+    @property
+    def crowd_energy_before(self) -> array:
+        """Per-pitch crowd energy before each pitch, for bounds checks via min()/max()."""
+
+        return self.replay_log.crowd_energy_before
+
+    @property
+    def crowd_energy_after(self) -> array:
+        return self.replay_log.crowd_energy_after
 
     def _play_half(
         self,
@@ -389,27 +893,32 @@ class GameState:
             defense=defense,
             pitcher=pitcher,
             situational_modifiers=self.stadium_modifiers,
-            seed=self._half_seed(),
+            seed=None if self.share_rng else self._half_seed(),
             starting_batter_index=batter_index,
             enable_crowd_effects=self.enable_crowd_effects,
             enable_stadium_effects=self.enable_stadium_effects,
             enable_organ_flair=self.enable_organ_flair,
+            record_replay=self.record_replay,
+            rng=self._rng if self.share_rng else None,
         )
-        half_state.play_to_completion(max_pitches=self.max_half_inning_pitches)
+        half_state._play_out(self.max_half_inning_pitches)
 
-        self.replay_log.extend(
-            self._annotate_events(
+        self._pitches_by_half[half != "top"] += half_state.pitch_number
+        if self.record_replay:
+            self.replay_log.extend_half(
                 half_state.replay_log,
                 inning=inning,
                 half=half,
                 batting_team=self.away_team if half == "top" else self.home_team,
             )
-        )
         return half_state.runs, half_state.batter_index % len(batting_lineup)
 
     def play_game(self) -> BoxScoreSummary:
-        total_frames = self.max_innings + self.max_extra_innings
-        for inning in range(1, total_frames + 1):
+        max_innings = self.max_innings
+        total_frames = max_innings + self.max_extra_innings
+        inning = 0
+        while inning < total_frames:
+            inning += 1
             away_runs, self._away_batter_index = self._play_half(
                 batting_lineup=self.away_lineup,
                 defense=self.home_defense,
@@ -420,9 +929,10 @@ class GameState:
             )
             self.away_score += away_runs
 
+            # From the last scheduled inning on, a home lead after the top
+            # decides the game without building a bottom half at all.
             home_runs = 0
-            should_play_bottom = inning < self.max_innings or self.away_score >= self.home_score
-            if should_play_bottom:
+            if inning < max_innings or self.away_score >= self.home_score:
                 home_runs, self._home_batter_index = self._play_half(
                     batting_lineup=self.home_lineup,
                     defense=self.away_defense,
@@ -433,16 +943,19 @@ class GameState:
                 )
                 self.home_score += home_runs
 
-            self.inning_lines.append([away_runs, home_runs])
+            self.inning_lines.append((away_runs, home_runs))
 
-            if inning >= self.max_innings and self.home_score != self.away_score:
-                break
-
-            if inning >= total_frames:
+            if inning >= max_innings and self.home_score != self.away_score:
                 break
 
         return self.to_box_score_summary()
 
+    def pitches_thrown(self) -> tuple[int, int]:
+        """Return ``(home_pitches, away_pitches)`` thrown by each team's pitcher."""
+
+        away_batting, home_batting = self._pitches_by_half
+        return away_batting, home_batting
+
     def to_box_score_summary(self) -> BoxScoreSummary:
         return BoxScoreSummary(
             game_id=self.game_id,
@@ -450,7 +963,8 @@ class GameState:
             away_team=self.away_team,
             home_score=self.home_score,
             away_score=self.away_score,
-            inning_lines=deepcopy(self.inning_lines),
+            # BoxScoreSummary flattens the rows into its own array, so no copy.
+            inning_lines=self.inning_lines,
         )
 
     def persist_box_score(
@@ -471,6 +985,7 @@ class GameState:
             "home_team": self.home_team,
             "away_team": self.away_team,
             "score": {"home": self.home_score, "away": self.away_score},
-            "inning_lines": deepcopy(self.inning_lines),
-            "events": deepcopy(self.replay_log),
+            # Rows are immutable tuples, so a shallow list is a safe snapshot.
+            "inning_lines": list(self.inning_lines),
+            "events": list(self.replay_log),
         }
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+try:  # pragma: no cover - POSIX only; Windows runs without the worker lock
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+ARTIFACT_DIR = PROJECT_ROOT / "tmp/e2e"
+
+
+@pytest.fixture(scope="session")
+def e2e_artifacts() -> dict[str, Path]:
+    """Generate the seeded e2e artifacts once for every test module in the session.
+
+    ``run_e2e.py`` reuses its cached outputs when the simulation sources are
+    unchanged. The lock keeps parallel pytest workers from rewriting the same
+    files at once; whoever waits on it gets a cache hit.
+    """
+
+    ARTIFACT_DIR.mkdir(parents=True, exist_ok=True)
+    with open(ARTIFACT_DIR / ".lock", "w") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        subprocess.run(
+            [sys.executable, "scripts/run_e2e.py", "--seed", "42"],
+            cwd=PROJECT_ROOT,
+            check=True,
+        )
+    return {
+        "replay": ARTIFACT_DIR / "replay_log.json",
+        "box_score": ARTIFACT_DIR / "box_score_summary.json",
+    }
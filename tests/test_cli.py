@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import io
+import json
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import pytest
+
+from simulation import cli
+
+
+def _run_cli(monkeypatch: pytest.MonkeyPatch, *argv: str) -> str:
+    monkeypatch.setattr("sys.argv", ["cli", *argv])
+    captured = io.StringIO()
+    with redirect_stdout(captured):
+        cli.main()
+    return captured.getvalue()
+
+
+def test_json_output_works_with_a_text_only_stdout(monkeypatch: pytest.MonkeyPatch) -> None:
+    output = _run_cli(monkeypatch, "--seed", "42", "--json")
+
+    events = json.loads(output)
+    assert events and events[0]["context"]["pitch_number"] == 1
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+def test_replay_log_honours_pretty(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, pretty: bool) -> None:
+    replay_path = tmp_path / "replay.json"
+    flags = ["--pretty"] if pretty else []
+    _run_cli(monkeypatch, "--seed", "42", "--full-game", "--json", f"--replay-log={replay_path}", *flags)
+
+    text = replay_path.read_text(encoding="utf-8")
+    assert ("\n" in text) is pretty
+    assert json.loads(text)["events"]
+
+
+@pytest.mark.parametrize("option", ["--num-games", "--workers"])
+@pytest.mark.parametrize("value", ["0", "-2"])
+def test_counts_below_one_are_rejected(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str], option: str, value: str
+) -> None:
+    with pytest.raises(SystemExit) as excinfo:
+        _run_cli(monkeypatch, "--full-game", f"{option}={value}")
+
+    assert excinfo.value.code == 2
+    assert f"{option} must be at least 1" in capsys.readouterr().err
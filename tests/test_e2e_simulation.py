@@ -3,15 +3,10 @@ from __future__ import annotations
 import json
 import math
 import numbers
-import subprocess
-import sys
 from pathlib import Path
 from typing import Any
 
-import pytest
-
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
-ARTIFACT_DIR = PROJECT_ROOT / "tmp/e2e"
 GOLDEN_DIR = PROJECT_ROOT / "tests" / "fixtures"
 GOLDEN_REPLAY = GOLDEN_DIR / "e2e_replay_log.json"
 GOLDEN_BOX = GOLDEN_DIR / "e2e_box_score_summary.json"
@@ -24,6 +19,11 @@ def load_json(path: Path) -> Any:
 
 
 def assert_structures_close(actual: Any, expected: Any, *, path: str = "root") -> None:
+    # Exact equality implies every leaf is within tolerance; one C-level
+    # comparison settles the common case, and the walk below only runs to
+    # check near-misses and name the first mismatching path.
+    if actual == expected:
+        return
     if isinstance(expected, dict):
         assert isinstance(actual, dict), f"{path} expected dict got {type(actual)}"
         assert set(actual.keys()) == set(expected.keys()), f"{path} keys differ"
@@ -43,19 +43,6 @@ def assert_structures_close(actual: Any, expected: Any, *, path: str = "root") -
         assert actual == expected, f"{path} mismatch: {actual} vs {expected}"
 
 
-@pytest.fixture(scope="session")
-def e2e_artifacts() -> dict[str, Path]:
-    subprocess.run(
-        [sys.executable, "scripts/run_e2e.py", "--seed", "42"],
-        cwd=PROJECT_ROOT,
-        check=True,
-    )
-    return {
-        "replay": ARTIFACT_DIR / "replay_log.json",
-        "box_score": ARTIFACT_DIR / "box_score_summary.json",
-    }
-
-
 def test_replay_matches_golden_snapshot(e2e_artifacts: dict[str, Path]) -> None:
     actual = load_json(e2e_artifacts["replay"])
     expected = load_json(GOLDEN_REPLAY)
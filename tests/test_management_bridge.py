@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from simulation.management_bridge import load_management_state
+
+
+def _write_bridge(path: Path, team_name: str, *, mtime_ns: int) -> None:
+    path.write_text(json.dumps({"team": {"id": "club", "name": team_name}}), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_bridge_cache_rereads_after_mtime_or_size_change(tmp_path: Path) -> None:
+    path = tmp_path / "manager_state.json"
+    _write_bridge(path, "Peanuts", mtime_ns=1_000_000_000)
+    assert load_management_state(path).team_name == "Peanuts"
+
+    # Same size and mtime: served from the cache without reading the file.
+    _write_bridge(path, "Walnuts", mtime_ns=1_000_000_000)
+    assert load_management_state(path).team_name == "Peanuts"
+
+    # Same size, newer mtime.
+    _write_bridge(path, "Walnuts", mtime_ns=2_000_000_000)
+    assert load_management_state(path).team_name == "Walnuts"
+
+    # Same mtime, different size.
+    _write_bridge(path, "Pistachios", mtime_ns=2_000_000_000)
+    assert load_management_state(path).team_name == "Pistachios"
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from simulation import persistence
+from simulation._json import dumps, loads
+from simulation.persistence import (
+    BoxScoreSummary,
+    FinanceLedger,
+    SeasonState,
+    apply_migrations,
+    load_season_state,
+    register_migration,
+    save_season_state,
+)
+from simulation.persistence_binary import read_box_scores, write_box_scores
+
+BOX_SCORES = [
+    BoxScoreSummary(
+        game_id="g-001",
+        home_team="Peanuts Club",
+        away_team="Tōkyō Ñandúes ⚾",
+        home_score=4,
+        away_score=2,
+        inning_lines=[(0, 1), (2, 0), (0, 3)],
+    ),
+    BoxScoreSummary(
+        game_id="g-002",
+        home_team="Tōkyō Ñandúes ⚾",
+        away_team="Peanuts Club",
+        home_score=0,
+        away_score=0,
+        inning_lines=[],
+    ),
+]
+
+
+def test_binary_box_scores_round_trip(tmp_path: Path) -> None:
+    path = write_box_scores(tmp_path / "scores.bin", BOX_SCORES)
+
+    assert read_box_scores(path) == BOX_SCORES
+
+
+def test_binary_season_state_round_trip(tmp_path: Path) -> None:
+    state = SeasonState.empty(2024)
+    state.box_scores.extend(BOX_SCORES)
+
+    path = save_season_state(state, tmp_path / "season.json", binary=True)
+
+    assert (tmp_path / "season.box_scores.bin").exists()
+    assert load_season_state(path).box_scores == BOX_SCORES
+
+
+def test_registered_migrations_chain_across_versions(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(persistence, "MIGRATIONS", {})
+    monkeypatch.setattr(persistence, "_MIGRATION_TARGETS", {})
+    monkeypatch.setattr(persistence, "_MIGRATION_PLANS", {})
+
+    @register_migration("0.8.0", "0.9.0")
+    def add_upgrades(raw):
+        return {**raw, "stadium_upgrades": {}, "version": "0.9.0"}
+
+    @register_migration("0.9.0", "1.0.0")
+    def add_pricing(raw):
+        return {**raw, "concessions_pricing": {}, "version": "1.0.0"}
+
+    migrated = apply_migrations({"version": "0.8.0", "season_year": 2023})
+
+    assert migrated == {
+        "version": "1.0.0",
+        "season_year": 2023,
+        "stadium_upgrades": {},
+        "concessions_pricing": {},
+    }
+    assert apply_migrations({"version": "0.9.0"})["version"] == "1.0.0"
+    assert apply_migrations({"version": "1.0.0"}) == {"version": "1.0.0"}
+
+
+def test_inning_lines_read_back_as_rows() -> None:
+    box = BOX_SCORES[0]
+
+    assert list(box.innings()) == [(0, 1), (2, 0), (0, 3)]
+    assert box.to_dict()["inning_lines"] == [[0, 1], [2, 0], [0, 3]]
+    assert BoxScoreSummary.from_dict(box.to_dict()) == box
+    assert loads(dumps(box))["inning_lines"] == [0, 1, 2, 0, 0, 3]
+
+
+def test_finance_totals_follow_in_place_edits() -> None:
+    ledger = FinanceLedger(
+        cash_on_hand=0.0,
+        revenue={"gate": 100.0},
+        expenses={"travel": 25.0},
+        ticket_price=20.0,
+        promotions=[],
+        concessions_pricing={"Soda": 4.0},
+    )
+    assert (ledger.recurring_revenue, ledger.recurring_expenses, ledger.concessions_total) == (100.0, 25.0, 4.0)
+
+    ledger.revenue["media"] = 50.0
+    ledger.expenses.pop("travel")
+    ledger.concessions_pricing.update(Snacks=5.5)
+    assert (ledger.recurring_revenue, ledger.recurring_expenses, ledger.concessions_total) == (150.0, 0, 9.5)
+
+    ledger.revenue = {"gate": 10.0}
+    assert ledger.recurring_revenue == 10.0
+    assert FinanceLedger.from_dict(ledger.to_dict()) == ledger
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import pytest
+
+from simulation import schemas
+from simulation.management_bridge import load_management_state
+
+
+@pytest.fixture(autouse=True)
+def _fresh_validators():
+    schemas.get_validator.cache_clear()
+    yield
+    schemas.get_validator.cache_clear()
+
+
+def test_get_validator_compiles_once_and_validates() -> None:
+    pytest.importorskip("jsonschema")
+
+    validator = schemas.get_validator("team")
+
+    assert schemas.get_validator("team") is validator
+    team = {**load_management_state().team_payload(), "version": schemas.SCHEMA_VERSION}
+    validator.validate(team)
+    assert not validator.is_valid({"id": "club"})
+
+
+def test_get_validator_without_jsonschema(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(schemas, "_jsonschema_validators", None)
+
+    with pytest.raises(ImportError, match="jsonschema"):
+        schemas.get_validator("team")
+
+
+def test_schema_builders_return_independent_copies() -> None:
+    schema = schemas.team_schema()
+    schema["required"].append("owner")
+
+    assert "owner" not in schemas.team_schema()["required"]
+    assert "owner" not in schemas._SCHEMAS_BY_NAME["team"]["required"]
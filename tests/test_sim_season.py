@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+import sim_season  # noqa: E402
+
+
+def _home_win(spec: dict) -> tuple:
+    summary = sim_season.BoxScoreSummary(
+        game_id=spec["game_id"],
+        home_team=spec["home_team"],
+        away_team=spec["away_team"],
+        home_score=3,
+        away_score=1,
+    )
+    return summary, 0, 0
+
+
+def test_standings_keep_teams_with_the_same_name_apart(monkeypatch: pytest.MonkeyPatch) -> None:
+    manager_state = replace(sim_season.load_management_state(), team_name="Rival Club")
+    monkeypatch.setattr(sim_season, "load_management_state", lambda: manager_state)
+    monkeypatch.setattr(sim_season, "_play_season_game", _home_win)
+
+    summary = sim_season.run_simulated_season(games=3, series_length=3, season_year=2024, seed=5)
+
+    home, away = summary["standings"]
+    assert home["team_id"] == away["team_id"] == "Rival Club"
+    assert (home["wins"], home["losses"], home["runs_for"], home["runs_against"]) == (3, 0, 9, 3)
+    assert (away["wins"], away["losses"], away["runs_for"], away["runs_against"]) == (0, 3, 3, 9)
+
+
+def _run_season(tmp_path: Path, workers: int) -> tuple[bytes, bytes]:
+    summary = tmp_path / f"summary-{workers}.json"
+    state = tmp_path / f"state-{workers}.json"
+    subprocess.run(
+        [
+            sys.executable,
+            str(PROJECT_ROOT / "scripts" / "sim_season.py"),
+            "--games=6",
+            "--seed=5",
+            f"--workers={workers}",
+            f"--summary={summary}",
+            f"--season-state-path={state}",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return summary.read_bytes(), state.read_bytes()
+
+
+def test_parallel_season_matches_serial_output(tmp_path: Path) -> None:
+    assert _run_season(tmp_path, workers=2) == _run_season(tmp_path, workers=1)
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import io
+import json
+from dataclasses import asdict, replace
+
+import pytest
+
+from simulation._json import dumps
+from simulation.fixtures import SAMPLE_BATTER, SAMPLE_DEFENSE, SAMPLE_PITCHER, SAMPLE_STADIUM
+from simulation.state import GameState, HalfInningState
+
+LINEUP = [SAMPLE_BATTER] * 9
+PITCHER = SAMPLE_PITCHER["ratings"]
+
+
+def _half(**kwargs: object) -> HalfInningState:
+    return HalfInningState(LINEUP, SAMPLE_DEFENSE, PITCHER, SAMPLE_STADIUM["modifiers"], **kwargs)
+
+
+def test_simulate_batch_matches_halves_played_one_by_one() -> None:
+    seeds = list(range(40))
+    runs, pitches = HalfInningState.simulate_batch(
+        seeds,
+        lineup=LINEUP,
+        defense=SAMPLE_DEFENSE,
+        pitcher=PITCHER,
+        situational_modifiers=SAMPLE_STADIUM["modifiers"],
+    )
+
+    expected = []
+    for seed in seeds:
+        half = _half(seed=seed, record_replay=False)
+        half.play_to_completion()
+        expected.append((half.runs, half.pitch_number))
+
+    assert list(zip(runs, pitches)) == expected
+
+
+def test_pitch_events_share_read_only_modifiers() -> None:
+    half = _half(seed=7)
+    first = half.pitch_once()
+    second = half.pitch_once()
+    context_before = dict(second.context_modifiers)
+
+    assert first.modifier_flags is second.modifier_flags
+    for mapping in (first.context_modifiers, first.crowd_modifiers, first.modifier_flags):
+        with pytest.raises(TypeError):
+            mapping["stadium_test"] = 1.0
+
+    assert second.context_modifiers == context_before
+    assert "stadium_test" not in half.events[0].context_modifiers
+    payload = first.as_payload()["modifiers"]
+    payload["applied"]["stadium_test"] = 1.0
+    assert "stadium_test" not in first.context_modifiers
+    assert json.loads(dumps(first)) == json.loads(dumps(asdict(first)))
+
+
+def test_effective_modifiers_follow_stadium_changes_mid_half() -> None:
+    modifiers = dict(SAMPLE_STADIUM["modifiers"])
+    half = HalfInningState(
+        LINEUP, SAMPLE_DEFENSE, PITCHER, modifiers, seed=3, enable_crowd_effects=False
+    )
+    assert half.pitch_once().context_modifiers == modifiers
+
+    modifiers["power"] = 0.25
+    assert half.pitch_once().context_modifiers["power"] == 0.25
+
+    half.base_modifiers = {"global": 0.1}
+    assert half.pitch_once().context_modifiers == {"global": 0.1}
+
+
+def test_lineup_substitution_uses_the_new_batter() -> None:
+    lineup = list(LINEUP)
+    half = HalfInningState(lineup, SAMPLE_DEFENSE, PITCHER, seed=1)
+    half.pitch_once()
+
+    pinch_hitter = {**SAMPLE_BATTER, "ratings": replace(SAMPLE_BATTER["ratings"])}
+    lineup[half.batter_index % len(lineup)] = pinch_hitter
+    assert half._participants(half.batter_index % len(lineup)).batter is pinch_hitter["ratings"]
+
+
+def test_play_to_completion_returns_a_list_of_recorded_events() -> None:
+    half = _half(seed=11)
+    events = half.play_to_completion()
+
+    assert isinstance(events, list)
+    assert len(events) == half.pitch_number == len(half.replay_log)
+    assert events[-1].outs_after == 3 or half.pitch_number == 100
+
+
+def test_events_raise_when_replay_is_not_recorded() -> None:
+    half = _half(seed=11, record_replay=False)
+
+    assert half.play_to_completion() == []
+    with pytest.raises(RuntimeError, match="record_replay"):
+        half.events
+
+
+def test_replay_stream_writes_the_recorded_replay_as_ndjson() -> None:
+    recorded = _half(seed=21)
+    recorded.play_to_completion()
+
+    stream = io.BytesIO()
+    streamed = _half(seed=21, replay_stream=stream)
+    streamed.play_to_completion()
+
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == streamed.pitch_number == len(recorded.replay_log)
+    assert [json.loads(line) for line in lines] == list(recorded.replay_log)
+
+
+def _game(seed: int, **kwargs: object) -> GameState:
+    return GameState(
+        game_id="test-game",
+        home_team="Home",
+        away_team="Away",
+        home_lineup=LINEUP,
+        away_lineup=LINEUP,
+        home_pitcher=PITCHER,
+        away_pitcher=PITCHER,
+        home_defense=SAMPLE_DEFENSE,
+        away_defense=SAMPLE_DEFENSE,
+        stadium_modifiers=SAMPLE_STADIUM["modifiers"],
+        seed=seed,
+        **kwargs,
+    )
+
+
+def test_score_only_game_matches_the_recorded_game() -> None:
+    recorded = _game(8)
+    score_only = _game(8, record_replay=False)
+
+    assert score_only.play_game() == recorded.play_game()
+    assert score_only.pitches_thrown() == recorded.pitches_thrown()
+    assert len(score_only.replay_log) == 0
+    assert len(recorded.replay_log) == sum(recorded.pitches_thrown())
+
+
+def test_shared_rng_games_are_deterministic_per_seed() -> None:
+    first = _game(8, share_rng=True)
+    second = _game(8, share_rng=True)
+
+    assert first.play_game() == second.play_game()
+    assert list(first.replay_log) == list(second.replay_log)
@@ -20,16 +20,13 @@ def _reserve_port() -> int:
         return sock.getsockname()[1]
 
 
-@pytest.fixture(scope="session")
-def e2e_artifacts() -> dict[str, Path]:
-    subprocess.run(
-        [sys.executable, "scripts/run_e2e.py", "--seed", "42"],
-        cwd=PROJECT_ROOT,
-        check=True,
-    )
-    return {
-        "replay": PROJECT_ROOT / "tmp/e2e/replay_log.json",
-    }
+def _wait_for_port(port: int, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            if sock.connect_ex(("localhost", port)) == 0:
+                return
+        time.sleep(0.01)
 
 
 def test_viewer_renders_replay_without_console_errors(e2e_artifacts: dict[str, Path]) -> None:
@@ -42,7 +39,7 @@ def test_viewer_renders_replay_without_console_errors(e2e_artifacts: dict[str, P
     )
 
     try:
-        time.sleep(0.5)
+        _wait_for_port(port)
         with sync_playwright() as playwright_ctx:
             try:
                 browser = playwright_ctx.chromium.launch(headless=True)